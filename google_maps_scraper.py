@@ -1,22 +1,39 @@
 # -*- coding: utf-8 -*-
-import time
 import csv
+import codecs
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
-from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import (TimeoutException, NoSuchElementException, InvalidSessionIdException,
+                                        WebDriverException)
 from selenium.webdriver.common.keys import Keys
 import re
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 import sys
 import io
 import string
-
-# Force UTF-8 encoding for stdout
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+import functools
+import itertools
+import unicodedata
+import importlib.resources
+import os
+import pathlib
+import tempfile
+import multiprocessing
+import threading
+import atexit
+import errno
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+# Force UTF-8 encoding for stdout (in place, without stacking a second buffered wrapper)
+if hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(encoding='utf-8', line_buffering=False)
 
 # Text preprocessing imports
 try:
@@ -27,9 +44,17 @@ except ImportError:
     print("Note: textblob not available. Install with: pip install textblob")
 
 try:
-    from camel_tools.utils.normalize import normalize_alef_maksura_ar, normalize_alef_ar, normalize_teh_marbuta_ar
+    from symspellpy import SymSpell, Verbosity
+    SYMSPELL_AVAILABLE = True
+except ImportError:
+    SYMSPELL_AVAILABLE = False
+    print("Note: symspellpy not available. Install with: pip install symspellpy")
+
+# SymSpell is preferred; TextBlob is the slower fallback corrector
+SPELLCHECK_AVAILABLE = SYMSPELL_AVAILABLE or TEXTBLOB_AVAILABLE
+
+try:
     from camel_tools.dialectid import DialectIdentifier
-    from camel_tools.utils.dediac import dediac_ar
     CAMEL_AVAILABLE = True
     print("✓ CAMeL Tools loaded successfully")
 except ImportError:
@@ -38,14 +63,291 @@ except ImportError:
 
 try:
     import langdetect
+    from langdetect import DetectorFactory, PROFILES_DIRECTORY
     LANGDETECT_AVAILABLE = True
 except ImportError:
     LANGDETECT_AVAILABLE = False
     print("Note: langdetect not available. Install with: pip install langdetect")
 
+# Bulk CSV writers for review lists
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+    print("Note: pandas not available. Install with: pip install pandas")
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as pa_feather
+    import pyarrow.parquet as pa_parquet
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    print("Note: pyarrow not available. Install with: pip install pyarrow")
+
+# Shared placeholder values, interned once and reused for every review
+NA = sys.intern('N/A')
+UNKNOWN = sys.intern('unknown')
+
+# Review fields in CSV column order
+REVIEW_FIELDS = ('name', 'date', 'rating', 'text')
+
+# Arabic normalization in one C-level translate pass, matching CAMeL's dediac_ar,
+# normalize_alef_ar, normalize_alef_maksura_ar and normalize_teh_marbuta_ar
+_AR_NORMALIZE = str.maketrans({
+    # Remove diacritics (tanween, harakat, shadda, sukun, dagger alef)
+    **dict.fromkeys('\u064b\u064c\u064d\u064e\u064f\u0650\u0651\u0652\u0670'),
+    # Normalize different forms of Alef
+    '\u0623': '\u0627', '\u0625': '\u0627', '\u0622': '\u0627', '\u0671': '\u0627',
+    # Normalize Alef Maksura
+    '\u0649': '\u064a',
+    # Normalize Teh Marbuta
+    '\u0629': '\u0647',
+})
+
+# Any character _AR_NORMALIZE would change
+_RE_AR_FOLDABLE = re.compile('[' + ''.join(map(chr, _AR_NORMALIZE)) + ']')
+
+# Precompiled patterns used by the text processing hot path
+_RE_AR = re.compile(r'[\u0600-\u06FF]')
+_RE_EN = re.compile(r'[A-Za-z]')
+_RE_WS = re.compile(r'\s+')
+_RE_EN_RUN = re.compile(r'[A-Za-z\s]+')
+# Whole words, keeping contractions such as "isn't" in one token
+_RE_EN_WORD = re.compile(r"[A-Za-z]+(?:['\u2019][A-Za-z]+)*")
+
+# Translation tables that delete Arabic / Latin letters; the length drop counts them in one C pass
+_AR_DELETE = dict.fromkeys(range(0x0600, 0x0700))
+_EN_DELETE = dict.fromkeys(map(ord, string.ascii_letters))
+
+
+def _count_chars(text, delete_table):
+    """Count the characters of text removed by a deletion translation table"""
+    return len(text) - len(text.translate(delete_table))
+
+
+def _csv_cell(value):
+    """Stringify a review value the way csv.writer does, keeping None for an empty cell"""
+    return None if value is None else str(value)
+
+# The processor only distinguishes Arabic from English, so only these profiles are loaded
+LANGDETECT_PROFILES = ('en', 'ar')
+
+# Upper bound on Chrome instances driven at once by scrape_many_reviews_function
+MAX_SCRAPER_WORKERS = 4
+
+# Preprocessing switches to worker processes at this many reviews; below it the
+# per-worker model load costs more than it saves
+PARALLEL_PREPROCESS_MIN_REVIEWS = 500
+PREPROCESS_WORKERS = os.cpu_count() or 1
+PREPROCESS_BATCH_SIZE = 32
+
+# Write buffer for CSV output, so rows reach the OS in large chunks
+CSV_BUFFER_SIZE = 1 << 20
+
+# Non-verbose preprocessing prints one progress line per this many reviews
+PROGRESS_INTERVAL = 100
+
+# Maximum number of memoized entries kept by each per-text preprocessing cache
+PREPROCESS_CACHE_SIZE = 131072
+
+
+@functools.lru_cache(maxsize=1)
+def _get_langdetect_factory():
+    """Build one seeded langdetect factory holding only LANGDETECT_PROFILES"""
+    if not LANGDETECT_AVAILABLE:
+        return None
+
+    try:
+        profiles = []
+        for lang in LANGDETECT_PROFILES:
+            with open(os.path.join(PROFILES_DIRECTORY, lang), encoding='utf-8') as f:
+                profiles.append(f.read())
+
+        factory = DetectorFactory()
+        factory.seed = 0
+        factory.load_json_profile(profiles)
+        return factory
+    except Exception as e:
+        print(f"Warning: Could not load langdetect profiles: {e}")
+        return None
+
+
+@functools.lru_cache(maxsize=PREPROCESS_CACHE_SIZE)
+def _detect_language(text):
+    """Detect language of text (cached)"""
+    if not text or len(text.strip()) < 3:
+        return UNKNOWN
+
+    try:
+        if LANGDETECT_AVAILABLE:
+            factory = _get_langdetect_factory()
+            if factory is None:
+                return langdetect.detect(text)
+            detector = factory.create()
+            detector.append(text)
+            return detector.detect()
+        else:
+            # Simple heuristic
+            arabic_chars = _count_chars(text, _AR_DELETE)
+            english_chars = _count_chars(text, _EN_DELETE)
+
+            if arabic_chars > english_chars:
+                return 'ar'
+            elif english_chars > arabic_chars:
+                return 'en'
+            else:
+                return 'mixed'
+    except:
+        return UNKNOWN
+
+
+@functools.lru_cache(maxsize=PREPROCESS_CACHE_SIZE)
+def _normalize_arabic_text(text):
+    """Normalize Arabic text without requiring CAMeL Tools (cached)"""
+    if not text:
+        return text
+
+    try:
+        # Quick check: text that is already NFKC and has nothing to fold skips both passes
+        if unicodedata.is_normalized('NFKC', text) and not _RE_AR_FOLDABLE.search(text):
+            return _RE_WS.sub(' ', text).strip()
+
+        # NFKC folds presentation forms to base letters while keeping hamza letters composed
+        text = unicodedata.normalize('NFKC', text).translate(_AR_NORMALIZE)
+        return _RE_WS.sub(' ', text).strip()
+
+    except Exception as e:
+        print(f"Warning: Arabic normalization failed: {e}")
+        return text
+
+
+@functools.lru_cache(maxsize=1)
+def _get_symspell():
+    """Load the SymSpell English frequency dictionary once"""
+    if not SYMSPELL_AVAILABLE:
+        return None
+
+    try:
+        sym_spell = SymSpell(max_dictionary_edit_distance=2, prefix_length=7)
+        dictionary_path = importlib.resources.files('symspellpy') / 'frequency_dictionary_en_82_765.txt'
+        if not sym_spell.load_dictionary(str(dictionary_path), term_index=0, count_index=1):
+            print("Warning: SymSpell dictionary could not be loaded")
+            return None
+        return sym_spell
+    except Exception as e:
+        print(f"Warning: Could not set up SymSpell: {e}")
+        return None
+
+
+def _symspell_correct_word(sym_spell, word):
+    """Return SymSpell's top suggestion for a single word"""
+    # Short words and contractions are left alone; SymSpell's dictionary has no apostrophes
+    if len(word) < 3 or "'" in word or '\u2019' in word:
+        return word
+
+    # Only trust a single edit on short words
+    max_edit_distance = 1 if len(word) < 5 else 2
+    suggestions = sym_spell.lookup(word, Verbosity.TOP, max_edit_distance=max_edit_distance,
+                                   include_unknown=True, transfer_casing=True)
+    return suggestions[0].term if suggestions else word
+
+
+def _spell_correct(text):
+    """Spell correct text with SymSpell, falling back to TextBlob"""
+    sym_spell = _get_symspell()
+    if sym_spell is not None:
+        # Correct word by word so punctuation and spacing are preserved
+        return _RE_EN_WORD.sub(lambda m: _symspell_correct_word(sym_spell, m.group(0)), text)
+
+    if TEXTBLOB_AVAILABLE:
+        return str(TextBlob(text).correct())
+
+    return text
+
+
+@functools.lru_cache(maxsize=PREPROCESS_CACHE_SIZE)
+def _correct_english_text(text):
+    """Correct English text with confidence checking (cached)"""
+    if not SPELLCHECK_AVAILABLE or not text:
+        return text
+
+    try:
+        corrected = _spell_correct(text)
+
+        # Only apply correction if the change makes sense
+        original_words = text.lower().split()
+        corrected_words = corrected.lower().split()
+
+        # Check if too many words changed (likely false positives)
+        if len(original_words) != len(corrected_words):
+            return text  # Keep original if word count changed
+
+        changes = sum(1 for o, c in zip(original_words, corrected_words) if o != c)
+        change_ratio = changes / len(original_words) if original_words else 0
+
+        # If more than 30% of words changed, probably wrong
+        if change_ratio > 0.3:
+            return text  # Keep original
+
+        # Check for common false positives
+        false_positives = {
+            'nice': 'vice',
+            'malls': 'walls',
+            'mall': 'wall',
+            'brands': 'bands',
+            'halal': 'hall',
+            'options': 'option',
+            'if': 'of',
+            'upscale': 'scale'
+        }
+
+        for original, wrong_correction in false_positives.items():
+            if original in text.lower() and wrong_correction in corrected.lower():
+                return text  # Keep original to avoid false positive
+
+        return corrected
+
+    except Exception as e:
+        print(f"Warning: English correction failed: {e}")
+        return text
+
+
+@functools.lru_cache(maxsize=PREPROCESS_CACHE_SIZE)
+def _clean_word(word):
+    """Clean a single reviewer name token (cached)"""
+    # Check if word contains Arabic characters
+    if _RE_AR.search(word):
+        # Arabic word - just normalize
+        return _normalize_arabic_text(word)
+    # English word - capitalize properly
+    return word.capitalize()
+
+
 class ReviewTextProcessor:
-    def __init__(self):
+    def __init__(self, verbose=False):
+        # Per-review logging (name/text changes, dialects) is only printed when verbose
+        self.verbose = verbose
+        # Periodic "Processed i/n" lines; pool workers turn this off and the parent reports instead
+        self.report_progress = True
         self.setup_camel_tools()
+        self.setup_language_detector()
+        self.setup_spell_checker()
+
+        # Cache per instance so the dialect model stays out of the cache key
+        self.identify_arabic_dialect = functools.lru_cache(maxsize=PREPROCESS_CACHE_SIZE)(self.identify_arabic_dialect)
+        self.process_review_text = functools.lru_cache(maxsize=PREPROCESS_CACHE_SIZE)(self.process_review_text)
+
+    def setup_language_detector(self):
+        """Load the langdetect profiles up front so the first review doesn't pay for them"""
+        if LANGDETECT_AVAILABLE and _get_langdetect_factory() is not None:
+            print(f"✓ langdetect profiles loaded: {', '.join(LANGDETECT_PROFILES)}")
+
+    def setup_spell_checker(self):
+        """Load the SymSpell dictionary up front so the first review doesn't pay for it"""
+        if SYMSPELL_AVAILABLE and _get_symspell() is not None:
+            print("✓ SymSpell dictionary loaded")
 
     def setup_camel_tools(self):
         """Initialize CAMeL Tools components"""
@@ -62,107 +364,66 @@ class ReviewTextProcessor:
 
     def detect_language(self, text):
         """Detect language of text"""
-        if not text or len(text.strip()) < 3:
-            return 'unknown'
-
-        try:
-            if LANGDETECT_AVAILABLE:
-                return langdetect.detect(text)
-            else:
-                # Simple heuristic
-                arabic_chars = len(re.findall(r'[\u0600-\u06FF]', text))
-                english_chars = len(re.findall(r'[a-zA-Z]', text))
-
-                if arabic_chars > english_chars:
-                    return 'ar'
-                elif english_chars > arabic_chars:
-                    return 'en'
-                else:
-                    return 'mixed'
-        except:
-            return 'unknown'
+        return _detect_language(text)
 
     def normalize_arabic_text(self, text):
-        """Normalize Arabic text using CAMeL Tools"""
-        if not CAMEL_AVAILABLE or not text:
-            return text
-
-        try:
-            # Remove diacritics
-            text = dediac_ar(text)
-
-            # Normalize different forms of Alef
-            text = normalize_alef_ar(text)
-
-            # Normalize Alef Maksura
-            text = normalize_alef_maksura_ar(text)
-
-            # Normalize Teh Marbuta
-            text = normalize_teh_marbuta_ar(text)
-
-            return text.strip()
-
-        except Exception as e:
-            print(f"Warning: Arabic normalization failed: {e}")
-            return text
+        """Normalize Arabic text (diacritics, Alef, Alef Maksura, Teh Marbuta)"""
+        return _normalize_arabic_text(text)
 
     def identify_arabic_dialect(self, text):
         """Identify Arabic dialect using CAMeL Tools"""
         if not CAMEL_AVAILABLE or not self.dialect_id or not text:
-            return 'unknown'
+            return UNKNOWN
 
         try:
             predictions = self.dialect_id.predict([text])
-            return predictions[0].top if predictions else 'unknown'
+            return predictions[0].top if predictions else UNKNOWN
         except Exception as e:
             print(f"Warning: Dialect identification failed: {e}")
-            return 'unknown'
+            return UNKNOWN
 
-    def correct_english_text(self, text):
-        """Correct English text with confidence checking"""
-        if not TEXTBLOB_AVAILABLE or not text:
-            return text
+    def identify_arabic_dialects(self, texts):
+        """Identify Arabic dialects for many texts with a single model call"""
+        if not CAMEL_AVAILABLE or not self.dialect_id or not texts:
+            return [UNKNOWN] * len(texts)
 
         try:
-            blob = TextBlob(text)
-            corrected = str(blob.correct())
-
-            # Only apply correction if the change makes sense
-            original_words = text.lower().split()
-            corrected_words = corrected.lower().split()
-
-            # Check if too many words changed (likely false positives)
-            if len(original_words) != len(corrected_words):
-                return text  # Keep original if word count changed
-
-            changes = sum(1 for o, c in zip(original_words, corrected_words) if o != c)
-            change_ratio = changes / len(original_words) if original_words else 0
-
-            # If more than 30% of words changed, probably wrong
-            if change_ratio > 0.3:
-                return text  # Keep original
-
-            # Check for common false positives
-            false_positives = {
-                'nice': 'vice',
-                'malls': 'walls',
-                'mall': 'wall',
-                'brands': 'bands',
-                'halal': 'hall',
-                'options': 'option',
-                'if': 'of',
-                'upscale': 'scale'
-            }
-
-            for original, wrong_correction in false_positives.items():
-                if original in text.lower() and wrong_correction in corrected.lower():
-                    return text  # Keep original to avoid false positive
-
-            return corrected
-
+            predictions = self.dialect_id.predict(list(texts))
+            return [prediction.top for prediction in predictions]
         except Exception as e:
-            print(f"Warning: English correction failed: {e}")
-            return text
+            print(f"Warning: Batch dialect identification failed: {e}")
+            return [UNKNOWN] * len(texts)
+
+    def identify_review_dialects(self, reviews):
+        """Identify dialects of all Arabic reviews up front (None for non-Arabic reviews)"""
+        dialects = [None] * len(reviews)
+        if not CAMEL_AVAILABLE or not self.dialect_id:
+            return dialects
+
+        # Bucket Arabic texts together with their positions
+        arabic_indices = []
+        arabic_texts = []
+        for i, review in enumerate(reviews):
+            text = review['text']
+            if text and text != NA and self.detect_language(text) == 'ar':
+                arabic_indices.append(i)
+                arabic_texts.append(text)
+
+        for i, dialect in zip(arabic_indices, self.identify_arabic_dialects(arabic_texts)):
+            dialects[i] = dialect
+
+        return dialects
+
+    def correct_english_text(self, text):
+        """Correct English text with confidence checking"""
+        return _correct_english_text(text)
+
+    def _correct_english_match(self, match):
+        """re.sub callback correcting one English run of mixed text"""
+        eng_part = match.group(0)
+        if len(eng_part.strip()) > 2:
+            return self.correct_english_text(eng_part)
+        return eng_part
 
     def process_mixed_text(self, text):
         """Process mixed Arabic-English text"""
@@ -176,13 +437,13 @@ class ReviewTextProcessor:
 
             for word in words:
                 # Check if word is primarily Arabic
-                arabic_chars = len(re.findall(r'[\u0600-\u06FF]', word))
-                english_chars = len(re.findall(r'[a-zA-Z]', word))
+                has_arabic = _RE_AR.search(word) is not None
+                has_english = _RE_EN.search(word) is not None
 
-                if arabic_chars > 0 and english_chars == 0:
+                if has_arabic and not has_english:
                     # Pure Arabic word - normalize
                     processed_word = self.normalize_arabic_text(word)
-                elif english_chars > 0 and arabic_chars == 0:
+                elif has_english and not has_arabic:
                     # Pure English word - keep as is (spell correction handled separately)
                     processed_word = word
                 else:
@@ -199,62 +460,56 @@ class ReviewTextProcessor:
 
     def clean_reviewer_name(self, name):
         """Clean reviewer name (Arabic/English/Mixed)"""
-        if not name or name == 'N/A':
+        if not name or name == NA:
             return name
 
         try:
             # Remove extra whitespace
-            name = re.sub(r'\s+', ' ', name).strip()
-
-            # Capitalize properly for English parts
-            words = name.split()
-            cleaned_words = []
-
-            for word in words:
-                # Check if word contains Arabic characters
-                if re.search(r'[\u0600-\u06FF]', word):
-                    # Arabic word - just normalize
-                    cleaned_word = self.normalize_arabic_text(word)
-                else:
-                    # English word - capitalize properly
-                    cleaned_word = word.capitalize()
-
-                cleaned_words.append(cleaned_word)
+            name = _RE_WS.sub(' ', name).strip()
 
-            return ' '.join(cleaned_words)
+            # Normalize Arabic words, capitalize English words
+            return ' '.join(_clean_word(word) for word in name.split())
 
         except Exception as e:
             print(f"Warning: Name cleaning failed: {e}")
             return name
 
-    def process_arabic_text(self, text):
-        """Process Arabic text specifically"""
+    def process_arabic_text(self, text, dialect=None):
+        """Process Arabic text specifically (dialect may be precomputed by a batch call)"""
         if not text:
             return text
 
-        # Normalize using CAMeL Tools
+        # Normalize diacritics and letter variants
         processed = self.normalize_arabic_text(text)
 
         # Identify dialect for debugging
-        if CAMEL_AVAILABLE and self.dialect_id:
-            dialect = self.identify_arabic_dialect(text)
-            if dialect != 'unknown':
+        if self.verbose and CAMEL_AVAILABLE and self.dialect_id:
+            if dialect is None:
+                dialect = self.identify_arabic_dialect(text)
+            if dialect != UNKNOWN:
                 print(f"  Detected dialect: {dialect}")
 
         return processed
 
-    def process_review_text(self, text):
+    def process_review_text(self, text, dialect=None):
         """Main function to process review text"""
-        if not text or text == 'N/A':
+        if not text or text == NA:
             return text
 
         try:
+            # ASCII-only text can't be Arabic, so skip language detection entirely
+            if text.isascii():
+                if len(text) < 8 or text.isalpha():
+                    # Very short text or a single word ("Good", "Nice") - nothing worth correcting
+                    return text.strip()
+                return _RE_WS.sub(' ', self.correct_english_text(text)).strip()
+
             # Detect language
             lang = self.detect_language(text)
 
             if lang == 'ar':
-                # Pure Arabic - normalize using CAMeL Tools
-                processed_text = self.process_arabic_text(text)
+                # Pure Arabic - normalize
+                processed_text = self.process_arabic_text(text, dialect)
 
             elif lang == 'en':
                 # Pure English - spell correct
@@ -265,16 +520,12 @@ class ReviewTextProcessor:
                 processed_text = self.process_mixed_text(text)
 
                 # Try to spell correct English parts
-                if TEXTBLOB_AVAILABLE:
-                    # Extract English words and correct them
-                    english_parts = re.findall(r'[a-zA-Z\s]+', processed_text)
-                    for eng_part in english_parts:
-                        if len(eng_part.strip()) > 2:
-                            corrected = self.correct_english_text(eng_part)
-                            processed_text = processed_text.replace(eng_part, corrected)
+                if SPELLCHECK_AVAILABLE:
+                    # Correct each English run in place with a single left-to-right pass
+                    processed_text = _RE_EN_RUN.sub(self._correct_english_match, processed_text)
 
             # Final cleanup
-            processed_text = re.sub(r'\s+', ' ', processed_text).strip()
+            processed_text = _RE_WS.sub(' ', processed_text).strip()
             return processed_text
 
         except Exception as e:
@@ -285,8 +536,8 @@ class ReviewTextProcessor:
         """Unified text preprocessing method - calls process_review_text"""
         return self.process_review_text(text)
 
-    def preprocess_reviews(self, reviews):
-        """Preprocess all reviews"""
+    def preprocess_reviews(self, reviews, in_place=False):
+        """Preprocess all reviews (in_place updates the given review dicts instead of copying them)"""
         if not reviews:
             return reviews
 
@@ -294,34 +545,114 @@ class ReviewTextProcessor:
         print("PREPROCESSING REVIEWS WITH CAMEL TOOLS")
         print("="*50)
 
+        if len(reviews) >= PARALLEL_PREPROCESS_MIN_REVIEWS and PREPROCESS_WORKERS > 1:
+            processed_reviews = self.preprocess_reviews_parallel(reviews, in_place)
+        else:
+            processed_reviews = self.preprocess_batch(reviews, in_place=in_place)
+
+        print(f"\n✓ Successfully preprocessed {len(processed_reviews)} reviews!")
+        return processed_reviews
+
+    def preprocess_reviews_iter(self, reviews, in_place=False):
+        """Yield processed reviews one at a time, batching dialect identification per chunk"""
+        # Generators have no length, so progress is reported without a total (0)
+        total = len(reviews) if hasattr(reviews, '__len__') else 0
+        reviews = iter(reviews)
+        offset = 0
+        while True:
+            batch = list(itertools.islice(reviews, PREPROCESS_BATCH_SIZE))
+            if not batch:
+                break
+            yield from self.preprocess_batch(batch, offset, total, in_place)
+            offset += len(batch)
+
+    def preprocess_reviews_parallel(self, reviews, in_place=False):
+        """Preprocess reviews in batches across forked worker processes"""
+        # Forked workers share this processor's loaded models copy-on-write. Without fork
+        # every worker would load its own copy, so stay in-process instead.
+        if not sys.platform.startswith('linux'):
+            return self.preprocess_batch(reviews, in_place=in_place)
+
+        # Forking while other threads run (e.g. scrape_many's preprocessing thread next to the
+        # Selenium calls) can leave the children deadlocked on locks held at fork time
+        if threading.active_count() > 1:
+            return self.preprocess_batch(reviews, in_place=in_place)
+
+        global _WORKER_PROCESSOR
+        batches = [reviews[i:i + PREPROCESS_BATCH_SIZE] for i in range(0, len(reviews), PREPROCESS_BATCH_SIZE)]
+        offsets = range(0, len(reviews), PREPROCESS_BATCH_SIZE)
+        totals = [len(reviews)] * len(batches)
+
+        _WORKER_PROCESSOR = self
+        try:
+            with ProcessPoolExecutor(max_workers=PREPROCESS_WORKERS, mp_context=multiprocessing.get_context('fork'),
+                                     initializer=_init_preprocess_worker) as executor:
+                processed_reviews = []
+                next_report = PROGRESS_INTERVAL
+                for batch, processed_batch in zip(batches, executor.map(_preprocess_batch, batches, offsets, totals)):
+                    if in_place:
+                        # Workers return copies; write them back so in_place means the same at any size
+                        for review, processed_review in zip(batch, processed_batch):
+                            review.update(processed_review)
+                        processed_batch = batch
+                    processed_reviews.extend(processed_batch)
+                    if len(processed_reviews) >= next_report or len(processed_reviews) == len(reviews):
+                        print(f"Processed {len(processed_reviews)}/{len(reviews)} reviews")
+                        next_report = (len(processed_reviews) // PROGRESS_INTERVAL + 1) * PROGRESS_INTERVAL
+                return processed_reviews
+        except Exception as e:
+            print(f"Warning: Parallel preprocessing failed, using a single process: {e}")
+            return self.preprocess_batch(reviews, in_place=in_place)
+        finally:
+            _WORKER_PROCESSOR = None
+
+    def preprocess_batch(self, reviews, offset=0, total=None, in_place=False):
+        """Preprocess a batch of reviews, identifying Arabic dialects in one call"""
+        if total is None:
+            total = len(reviews)
+        of_total = f"/{total}" if total else ""
         processed_reviews = []
 
-        for i, review in enumerate(reviews, 1):
-            print(f"\nProcessing review {i}/{len(reviews)}...")
+        # Identify dialects of all Arabic reviews in one batch (they are only used for logging)
+        if self.verbose:
+            dialects = self.identify_review_dialects(reviews)
+        else:
+            dialects = [None] * len(reviews)
 
-            processed_review = review.copy()
+        for i, (review, dialect) in enumerate(zip(reviews, dialects), offset + 1):
+            if self.verbose:
+                print(f"\nProcessing review {i}{of_total}...")
+            elif self.report_progress and (i % PROGRESS_INTERVAL == 0 or i == total):
+                print(f"Processed {i}{of_total} reviews")
 
             # Process reviewer name
             original_name = review['name']
             processed_name = self.clean_reviewer_name(original_name)
-            if original_name != processed_name:
+            if self.verbose and original_name != processed_name:
                 print(f"Name: {original_name} → {processed_name}")
-            processed_review['name'] = processed_name
 
             # Process review text
-            original_text = review['text']
-            if original_text and original_text != 'N/A':
-                processed_text = self.process_review_text(original_text)
-                if original_text != processed_text:
+            original_text = processed_text = review['text']
+            if original_text and original_text != NA:
+                processed_text = self.process_review_text(original_text, dialect)
+                if self.verbose and original_text != processed_text:
                     # Show truncated version for display
                     orig_display = original_text[:50] + "..." if len(original_text) > 50 else original_text
                     proc_display = processed_text[:50] + "..." if len(processed_text) > 50 else processed_text
                     print(f"Text: {orig_display} → {proc_display}")
-                processed_review['text'] = processed_text
+
+            # Callers that own the reviews have them updated in place; otherwise build the
+            # processed copy (every key of the review) in one step instead of copying and then
+            # overwriting two fields
+            if in_place:
+                review['name'] = processed_name
+                review['text'] = processed_text
+                processed_review = review
+            else:
+                processed_review = {**review, 'name': processed_name, 'text': processed_text}
 
             processed_reviews.append(processed_review)
 
-        print(f"\n✓ Successfully preprocessed {len(processed_reviews)} reviews!")
         return processed_reviews
 
     def test_preprocessing(self):
@@ -455,14 +786,185 @@ class ReviewTextProcessor:
                 print(f"❌ Name cleaning error for '{name}': {e}")
 
 
+# Process-wide text processor; the lock stops concurrent first callers (e.g. the scrapers
+# started by scrape_many_reviews_function) from each loading the models
+_TEXT_PROCESSOR = None
+_TEXT_PROCESSOR_LOCK = threading.Lock()
+
+def get_text_processor():
+    """Return the process-wide ReviewTextProcessor, loading its models on first use"""
+    global _TEXT_PROCESSOR
+    if _TEXT_PROCESSOR is None:
+        with _TEXT_PROCESSOR_LOCK:
+            if _TEXT_PROCESSOR is None:
+                _TEXT_PROCESSOR = ReviewTextProcessor()
+    return _TEXT_PROCESSOR
+
+
+# Text processor used by preprocessing worker processes; set by the parent before forking
+_WORKER_PROCESSOR = None
+
+def _init_preprocess_worker():
+    """Make sure the worker has a ReviewTextProcessor (forked workers inherit the parent's)"""
+    global _WORKER_PROCESSOR
+    if _WORKER_PROCESSOR is None:
+        _WORKER_PROCESSOR = get_text_processor()
+
+    # Workers stay silent; interleaved per-review output from N processes is unreadable
+    _WORKER_PROCESSOR.verbose = False
+    _WORKER_PROCESSOR.report_progress = False
+
+def _preprocess_batch(reviews, offset, total):
+    """Preprocess one batch of reviews inside a worker process"""
+    # The batch was unpickled into this worker, so it can be updated in place
+    return _WORKER_PROCESSOR.preprocess_batch(reviews, offset, total, in_place=True)
+
+
+# Selectors for the 'More' buttons that expand truncated review text
+MORE_BUTTON_SELECTORS = [
+    "button.Jj6La", # Common button class for 'More'
+    "button[aria-label^='See more']", # More descriptive aria-label
+    "span.LMgQJb", # Some 'More' text might be in a span
+    "span.app-inline-block.font-weight-500", # Another potential 'More' button type
+    "button[jsaction*='reviews.expand']", # Specific button with expand action
+    "g-review-controls > button", # Generic control button
+    "span.google-symbols.Q1oZ3b" # Yet another observation
+]
+
+# Seconds to poll for newly rendered 'More' buttons / newly loaded reviews before giving up
+MORE_BUTTON_WAIT = 1
+SCROLL_WAIT = 5
+
+# Seconds to wait for the review list to re-render after changing the sort order
+SORT_WAIT = 3
+
+# Assets the review panel never reads: photos, avatars, map tiles and web fonts
+BLOCKED_URL_PATTERNS = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg',
+                        '*.woff', '*.woff2', '*.ttf', '*/vt?*', '*/kh?*']
+
+# Persistent HTTP cache so repeat runs load the Maps JS bundles from disk. Each live
+# Chrome gets its own slot directory, since concurrent browsers must not share one.
+# Slots are claimed with an OS file lock, so scrapers in other processes skip them too,
+# and the OS drops the lock if a process dies without closing its scraper.
+CHROME_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'gmaps_cache')
+CHROME_CACHE_SIZE = 1 << 30
+# Far more than MAX_SCRAPER_WORKERS; past this, or where files cannot be locked, Chrome runs without the cache
+CHROME_CACHE_MAX_SLOTS = 32
+# Errors meaning another process holds the lock (flock / msvcrt.locking); any other error means locking is unsupported
+_LOCK_BUSY_ERRNOS = {errno.EWOULDBLOCK, errno.EAGAIN, errno.EACCES}
+_CACHE_SLOTS = {}  # slot -> descriptor of its locked lock file
+_CACHE_SLOTS_LOCK = threading.Lock()
+
+def _lock_cache_slot(slot):
+    """Lock the slot's lock file; returns its descriptor, or None if another process holds it.
+    Raises OSError if the file system cannot lock the file at all."""
+    fd = os.open(os.path.join(CHROME_CACHE_DIR, f'{slot}.lock'), os.O_RDWR | os.O_CREAT)
+    try:
+        if os.name == 'nt':
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return fd
+    except OSError as e:
+        os.close(fd)
+        if e.errno in _LOCK_BUSY_ERRNOS:
+            return None
+        raise
+
+def _acquire_cache_slot():
+    """Reserve the lowest cache slot not used by another live scraper; None if locking is unavailable"""
+    with _CACHE_SLOTS_LOCK:
+        try:
+            os.makedirs(CHROME_CACHE_DIR, exist_ok=True)
+            for slot in range(CHROME_CACHE_MAX_SLOTS):
+                if slot not in _CACHE_SLOTS:
+                    fd = _lock_cache_slot(slot)
+                    if fd is not None:
+                        _CACHE_SLOTS[slot] = fd
+                        return slot
+            print(f"Warning: All {CHROME_CACHE_MAX_SLOTS} browser cache directories are in use")
+        except OSError as e:
+            print(f"Warning: Could not reserve a browser cache directory: {e}")
+        return None
+
+def _release_cache_slot(slot):
+    """Return a cache slot for reuse by later scrapers"""
+    with _CACHE_SLOTS_LOCK:
+        fd = _CACHE_SLOTS.pop(slot, None)
+        if fd is not None:
+            # Closing the descriptor releases the lock
+            os.close(fd)
+
+# Review container and the per-review fields inside it
+REVIEW_SELECTOR = "div[data-review-id]"
+REVIEW_FIELD_SELECTORS = {
+    'name': "div.d4r55.fontTitleMedium",
+    'date': "div.DU9Pgb span.rsqaWe",
+    # Stars aria-label candidates in priority order; the second covers layouts without kvMYJc
+    'rating': ["div.DU9Pgb span.kvMYJc[role='img']", "span[role='img'][aria-label*='star']"],
+    'text': "div.MyEned span.wiI7pd",
+}
+
+# Number of review containers matching arguments[0] currently in the page
+JS_COUNT_REVIEWS = "return document.querySelectorAll(arguments[0]).length;"
+
+# data-review-id of the first review container matching arguments[0], or null
+JS_FIRST_REVIEW_ID = """
+const review = document.querySelector(arguments[0]);
+return review ? review.getAttribute('data-review-id') : null;
+"""
+
+# Clicks every visible, enabled element matching arguments[0] and returns the click count
+JS_EXPAND_ALL = """
+var buttons = document.querySelectorAll(arguments[0]);
+var clicked = 0;
+for (var i = 0; i < buttons.length; i++) {
+    var button = buttons[i];
+    if (button.offsetParent === null || button.disabled) continue;
+    try {
+        button.scrollIntoView({block: 'center'});
+        button.click();
+        clicked++;
+    } catch (e) {}
+}
+return clicked;
+"""
+
+# Returns the raw fields of every review container on the page in one call
+JS_EXTRACT_REVIEWS = """
+var fields = arguments[1];
+function read(container, selector) {
+    var element = container.querySelector(selector);
+    return element ? element.innerText : null;
+}
+return Array.from(document.querySelectorAll(arguments[0])).map(function (container) {
+    var rating = null;
+    for (var i = 0; i < fields.rating.length && !rating; i++) {
+        rating = container.querySelector(fields.rating[i]);
+    }
+    return {
+        id: container.getAttribute('data-review-id'),
+        name: read(container, fields.name),
+        date: read(container, fields.date),
+        rating: rating ? rating.getAttribute('aria-label') : null,
+        text: read(container, fields.text)
+    };
+});
+"""
+
 class GoogleMapsReviewScraper:
     def __init__(self):
         self.driver = None
-        self.text_processor = ReviewTextProcessor()
+        self.text_processor = get_text_processor()
+        self.cache_slot = _acquire_cache_slot()
         self.setup_driver()
 
     def setup_driver(self):
         """Setup Chrome driver with UTF-8 support for Arabic names"""
+        self.driver = self._create_driver()
+
+    def _create_driver(self):
+        """Create a Chrome driver with UTF-8 support for Arabic names"""
         chrome_options = Options()
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
@@ -472,14 +974,44 @@ class GoogleMapsReviewScraper:
         chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
         chrome_options.add_argument("--lang=en-US")
         chrome_options.add_argument("--accept-lang=en-US,en")
+        chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        if self.cache_slot is not None:
+            chrome_options.add_argument(f"--disk-cache-dir={os.path.join(CHROME_CACHE_DIR, str(self.cache_slot))}")
+            chrome_options.add_argument(f"--disk-cache-size={CHROME_CACHE_SIZE}")
 
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            driver = webdriver.Chrome(options=chrome_options)
+            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            try:
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+            except WebDriverException as e:
+                print(f"Warning: Could not block page assets: {e}")
+            return driver
         except Exception as e:
             print(f"Error setting up Chrome driver: {e}")
             return None
 
+    def ensure_driver(self):
+        """Return a live driver, recreating Chrome only if the session has died"""
+        if self.driver is not None:
+            try:
+                if self.driver.session_id is not None:
+                    # Raises if the browser session is gone
+                    self.driver.current_url
+                    return self.driver
+            except (InvalidSessionIdException, WebDriverException):
+                pass
+
+            print("Driver session lost, restarting Chrome...")
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+
+        self.setup_driver()
+        return self.driver
+
     def modify_url_for_english(self, url):
         """Modify URL to force English interface"""
         parsed = urlparse(url)
@@ -493,20 +1025,23 @@ class GoogleMapsReviewScraper:
         """Sort reviews by newest first"""
         try:
             print("Sorting reviews by newest first...")
+            first_id = self.first_review_id()
 
             # Wait for and click the sort dropdown
             sort_button = WebDriverWait(self.driver, 10).until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, "button[data-value='Sort']"))
             )
             self.driver.execute_script("arguments[0].click();", sort_button)
-            time.sleep(2)
 
-            # Select "Newest" option
+            # Select "Newest" option as soon as the menu has rendered it
             newest_option = WebDriverWait(self.driver, 5).until(
                 EC.element_to_be_clickable((By.XPATH, "//div[@role='menuitemradio'][contains(., 'Newest')]"))
             )
             self.driver.execute_script("arguments[0].click();", newest_option)
-            time.sleep(3)
+
+            # The list is re-rendered once the first review changes (it may not change
+            # if the place was already sorted that way, so a timeout is not an error)
+            self.wait_for_resort(first_id)
 
             print("✓ Successfully sorted by newest reviews")
             return True
@@ -518,17 +1053,6 @@ class GoogleMapsReviewScraper:
     def click_more_buttons(self):
         """Clicks 'More' buttons to expand full review text."""
         try:
-            more_buttons_selectors = [
-                "button.Jj6La", # Common button class for 'More'
-                "button[aria-label^='See more']", # More descriptive aria-label
-                "span.LMgQJb", # Some 'More' text might be in a span
-                # Add more selectors if needed based on observation
-                "span.app-inline-block.font-weight-500", # Another potential 'More' button type
-                "button[jsaction*='reviews.expand']", # Specific button with expand action
-                "g-review-controls > button", # Generic control button
-                "span.google-symbols.Q1oZ3b" # Yet another observation
-            ]
-            
             # Keep track of how many buttons were clicked in the current iteration
             # This loop will continue as long as new buttons are found and clicked
             # or until a maximum number of attempts is reached.
@@ -536,43 +1060,22 @@ class GoogleMapsReviewScraper:
             attempts_without_new_clicks = 0
             max_no_new_clicks_attempts = 3 # Stop if no new clicks after 3 attempts
             max_total_attempts = 10 # Global safety break for the loop
+            selectors = ", ".join(MORE_BUTTON_SELECTORS)
 
             for attempt_num in range(max_total_attempts):
-                found_and_clicked_in_iteration = False
-                current_iteration_clicks = 0
-
-                for selector in more_buttons_selectors:
-                    try:
-                        # Find all 'More' buttons that are visible and enabled
-                        buttons_to_click = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        
-                        for button in buttons_to_click:
-                            # Check if the button is within the current scrollable view and is interactable
-                            if button.is_displayed() and button.is_enabled():
-                                try:
-                                    # Scroll into view to ensure clickability
-                                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-                                    time.sleep(0.2) # Small wait after scroll
-                                    self.driver.execute_script("arguments[0].click();", button)
-                                    found_and_clicked_in_iteration = True
-                                    current_iteration_clicks += 1
-                                    time.sleep(0.5) # Short delay after each click to allow content to load
-                                except ElementClickInterceptedException:
-                                    # If click is intercepted, try clicking with ActionChains or more forceful JS
-                                    ActionChains(self.driver).move_to_element(button).click().perform()
-                                    found_and_clicked_in_iteration = True
-                                    current_iteration_clicks += 1
-                                    time.sleep(0.5)
-                                except Exception as e:
-                                    print(f"Warning: Error clicking button with selector {selector}: {e}")
-                                    # Continue to next button if there's an error
-                                    continue
-                    except Exception as e:
-                        # print(f"Warning: Error finding buttons with selector {selector}: {e}")
-                        # Continue to next selector if there's an error
-                        continue
-                
-                if found_and_clicked_in_iteration:
+                # Find, scroll to and click every visible 'More' button in a single round-trip,
+                # polling briefly for buttons that are still rendering
+                try:
+                    current_iteration_clicks = WebDriverWait(self.driver, MORE_BUTTON_WAIT, poll_frequency=0.25).until(
+                        lambda driver: driver.execute_script(JS_EXPAND_ALL, selectors)
+                    )
+                except TimeoutException:
+                    current_iteration_clicks = 0
+                except Exception as e:
+                    print(f"Warning: Error clicking 'More' buttons: {e}")
+                    current_iteration_clicks = 0
+
+                if current_iteration_clicks:
                     total_clicked_count += current_iteration_clicks
                     attempts_without_new_clicks = 0 # Reset counter as we found new buttons
                 else:
@@ -581,13 +1084,39 @@ class GoogleMapsReviewScraper:
                 if attempts_without_new_clicks >= max_no_new_clicks_attempts:
                     print(f"No new 'More' buttons found after {max_no_new_clicks_attempts} attempts. Stopping.")
                     break
-                
-                time.sleep(1) # Small delay before next iteration to allow page to settle
             
             print(f"Finished clicking 'More' buttons. Total expanded: {total_clicked_count}")
         except Exception as e:
             print(f"Critical error in click_more_buttons: {e}")
 
+    def count_loaded_reviews(self):
+        """Count the review containers currently loaded in the page"""
+        return self.driver.execute_script(JS_COUNT_REVIEWS, REVIEW_SELECTOR) or 0
+
+    def wait_for_more_reviews(self, last_count, timeout=SCROLL_WAIT):
+        """Wait until more than last_count reviews are loaded; returns False on timeout"""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(
+                lambda driver: self.count_loaded_reviews() > last_count
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def first_review_id(self):
+        """Return the data-review-id of the first review in the page"""
+        return self.driver.execute_script(JS_FIRST_REVIEW_ID, REVIEW_SELECTOR)
+
+    def wait_for_resort(self, previous_id, timeout=SORT_WAIT):
+        """Wait until the first review differs from previous_id; returns False on timeout"""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(
+                lambda driver: self.first_review_id() not in (None, previous_id)
+            )
+            return True
+        except TimeoutException:
+            return False
+
     def scroll_reviews(self, target_count):
         """Scroll through reviews to load more with improved method"""
         print("Loading reviews...")
@@ -602,8 +1131,7 @@ class GoogleMapsReviewScraper:
             self.click_more_buttons()
 
             # Count current reviews
-            review_elements = self.driver.find_elements(By.CSS_SELECTOR, "div[data-review-id]")
-            current_count = len(review_elements)
+            current_count = self.count_loaded_reviews()
 
             print(f"Currently loaded: {current_count} reviews (Target: {target_count})")
 
@@ -624,20 +1152,19 @@ class GoogleMapsReviewScraper:
                                 container.scrollTop = container.scrollHeight;
                             }
                         """)
-                        time.sleep(2)
 
-                        # Method 2: Page scroll
-                        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        time.sleep(2)
+                        # Method 2: Page scroll, only if method 1 loaded nothing
+                        if not self.wait_for_more_reviews(current_count, 2):
+                            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
 
-                        # Method 3: Find and scroll specific container
-                        containers = self.driver.find_elements(By.CSS_SELECTOR, "div[role='main'], .m6QErb")
-                        for container in containers:
-                            try:
-                                self.driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight;", container)
-                                time.sleep(1)
-                            except:
-                                continue
+                        # Method 3: Find and scroll specific container, only if nothing loaded yet
+                        if not self.wait_for_more_reviews(current_count, 2):
+                            containers = self.driver.find_elements(By.CSS_SELECTOR, "div[role='main'], .m6QErb")
+                            for container in containers:
+                                try:
+                                    self.driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight;", container)
+                                except:
+                                    continue
 
                     except Exception as e:
                         print(f"Alternative scroll methods failed: {e}")
@@ -667,199 +1194,268 @@ class GoogleMapsReviewScraper:
 
             last_count = current_count
             attempt += 1
-            time.sleep(3)
+
+            # Continue as soon as the scroll has loaded new reviews
+            self.wait_for_more_reviews(current_count)
 
         # Final expansion of review texts
         print("Final expansion of review texts...")
         self.click_more_buttons()
 
-        final_count = len(self.driver.find_elements(By.CSS_SELECTOR, "div[data-review-id]"))
+        final_count = self.count_loaded_reviews()
         print(f"Final loaded reviews: {final_count}")
         return True
 
     def extract_reviews(self, max_reviews):
         """Extract review data from the page with UTF-8 support"""
-        reviews = []
+        return list(self.iter_reviews(max_reviews))
+
+    def iter_reviews(self, max_reviews):
+        """Yield deduplicated review data from the page as it is parsed"""
+        extracted = 0
+        skipped = 0
         seen_reviews = set()
 
-        review_containers = self.driver.find_elements(By.CSS_SELECTOR, "div[data-review-id]")
-        print(f"Found {len(review_containers)} review containers")
+        # Read every review container's fields in-page with a single round-trip. This beats
+        # parsing driver.page_source: only the four fields cross the wire instead of the
+        # whole serialized page, and innerText keeps the rendered line breaks
+        try:
+            raw_reviews = self.driver.execute_script(JS_EXTRACT_REVIEWS, REVIEW_SELECTOR, REVIEW_FIELD_SELECTORS) or []
+        except Exception as e:
+            print(f"Error extracting reviews: {e}")
+            return
+
+        print(f"Found {len(raw_reviews)} review containers")
         print(f"Extracting data from {max_reviews} reviews...")
 
-        for i, container in enumerate(review_containers):
-            if len(reviews) >= max_reviews:
+        for i, raw in enumerate(raw_reviews):
+            if extracted >= max_reviews:
                 break
 
-            review_data = {
-                'name': 'N/A',
-                'date': 'N/A',
-                'rating': 'N/A',
-                'text': 'N/A'
-            }
+            review_data = dict.fromkeys(REVIEW_FIELDS, NA)
 
             try:
-                # Extract reviewer name (handles Arabic names with UTF-8)
-                try:
-                    name_element = container.find_element(By.CSS_SELECTOR, "div.d4r55.fontTitleMedium")
-                    review_data['name'] = name_element.text.strip()
-                except:
-                    pass
-
-                # Extract review date
-                try:
-                    date_element = container.find_element(By.CSS_SELECTOR, "div.DU9Pgb span.rsqaWe")
-                    review_data['date'] = date_element.text.strip()
-                except:
-                    pass
-
-                # Extract rating
-                try:
-                    rating_element = container.find_element(By.CSS_SELECTOR, "div.DU9Pgb span.kvMYJc[role='img']")
-                    aria_label = rating_element.get_attribute("aria-label")
-                    if aria_label:
-                        rating_match = re.search(r'(\d+)', aria_label)
-                        if rating_match:
-                            review_data['rating'] = rating_match.group(1) + " stars"
-                except:
-                    pass
-
-                # Extract review text
-                try:
-                    # The text element might be hidden and replaced by a 'More' button click.
-                    # We need to get the full text after clicking 'More' buttons.
-                    # The current implementation of click_more_buttons should handle this.
-                    text_element = container.find_element(By.CSS_SELECTOR, "div.MyEned span.wiI7pd")
-                    review_data['text'] = text_element.text.strip()
-                except:
-                    pass
-
-                # Create unique identifier
-                review_id = f"{review_data['name']}_{review_data['date']}_{review_data['rating']}"
-
-                if review_id not in seen_reviews and review_data['name'] != 'N/A':
+                # Fields missing from the container come back as None and stay 'N/A'
+                for field in ('name', 'date', 'text'):
+                    if raw.get(field) is not None:
+                        review_data[field] = raw[field].strip()
+
+                # Reviews without a name are rejected before any rating parsing or dedup work
+                if review_data['name'] == NA:
+                    skipped += 1
+                    continue
+
+                # Extract rating from the stars aria-label
+                aria_label = raw.get('rating')
+                if aria_label:
+                    rating_match = re.search(r'(\d+)', aria_label)
+                    if rating_match:
+                        review_data['rating'] = rating_match.group(1) + " stars"
+
+                # Nested elements repeat their container's data-review-id, so dedup on it and
+                # fall back to a (name, date, rating) tuple when it is missing
+                review_id = raw.get('id') or (review_data['name'], review_data['date'], review_data['rating'])
+
+                if review_id not in seen_reviews:
                     seen_reviews.add(review_id)
-                    reviews.append(review_data)
-                    print(f"Extracted review {len(reviews)}: {review_data['name'][:20]}...")
+                    extracted += 1
+                    if extracted % PROGRESS_INTERVAL == 0:
+                        print(f"Extracted {extracted} reviews")
+                    yield review_data
                 else:
-                    print(f"Skipping duplicate or invalid review {i+1}")
+                    skipped += 1
 
             except Exception as e:
                 print(f"Error extracting review {i+1}: {e}")
                 continue
 
-        return reviews
+        print(f"Extracted {extracted} reviews ({skipped} duplicate or invalid skipped)")
 
-    def preprocess_reviews(self, reviews):
+    def preprocess_reviews(self, reviews, in_place=False):
         """Preprocess all reviews using CAMeL Tools and TextBlob"""
-        if not reviews:
-            return reviews
-
-        print("\n" + "="*50)
-        print("PREPROCESSING REVIEWS WITH CAMEL TOOLS")
-        print("="*50)
-
-        processed_reviews = []
+        return self.text_processor.preprocess_reviews(reviews, in_place)
 
-        for i, review in enumerate(reviews, 1):
-            print(f"\nProcessing review {i}/{len(reviews)}...")
+    def load_reviews_page(self, url, num_reviews):
+        """Open the place, sort by newest and scroll until num_reviews are loaded; returns False if there are none"""
+        if not self.ensure_driver():
+            print("Driver not initialized")
+            return False
 
-            processed_review = review.copy()
+        # Modify URL for English interface
+        english_url = self.modify_url_for_english(url)
+        print("Opening URL...")
+        self.driver.get(english_url)
 
-            # Process reviewer name
-            original_name = review['name']
-            processed_review['name'] = self.text_processor.clean_reviewer_name(original_name)
-            if original_name != processed_review['name']:
-                print(f"  Name: {original_name} → {processed_review['name']}")
-
-            # Process review text
-            original_text = review['text']
-            processed_review['text'] = self.text_processor.process_review_text(original_text)
-            if original_text != processed_review['text'] and len(original_text) > 0:
-                print(f"  Text: {original_text[:50]}... → {processed_review['text'][:50]}...")
+        # Wait for reviews to be present
+        try:
+            WebDriverWait(self.driver, 15).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, REVIEW_SELECTOR))
+            )
+            print("Reviews found on page")
+        except TimeoutException:
+            print("No reviews found on this page")
+            return False
 
-            processed_reviews.append(processed_review)
+        # Sort by newest first
+        self.sort_by_newest()
 
-        print(f"\n✓ Successfully preprocessed {len(processed_reviews)} reviews!")
-        return processed_reviews
+        # Scroll to load more reviews
+        self.scroll_reviews(num_reviews)
+        return True
 
     def scrape_reviews(self, url, num_reviews):
         """Main scraping function with newest first sorting"""
-        if not self.driver:
-            print("Driver not initialized")
-            return []
+        return self._preprocess_scraped(self.extract_from_url(url, num_reviews))
 
+    def extract_from_url(self, url, num_reviews):
+        """Load a place and return its extracted, not yet preprocessed, reviews"""
         try:
-            # Modify URL for English interface
-            english_url = self.modify_url_for_english(url)
-            print("Opening URL...")
-            self.driver.get(english_url)
-            time.sleep(5)
-
-            # Wait for reviews to be present
-            try:
-                WebDriverWait(self.driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div[data-review-id]"))
-                )
-                print("Reviews found on page")
-            except TimeoutException:
-                print("No reviews found on this page")
+            if not self.load_reviews_page(url, num_reviews):
                 return []
 
-            # Sort by newest first
-            self.sort_by_newest()
-            time.sleep(3)
-
-            # Scroll to load more reviews
-            self.scroll_reviews(num_reviews)
-
-            # Extract review data
-            reviews = self.extract_reviews(num_reviews)
+            return self.extract_reviews(num_reviews)
 
-            # Preprocess reviews using CAMeL Tools
-            if reviews:
-                reviews = self.preprocess_reviews(reviews)
+        except Exception as e:
+            print(f"Error during scraping: {e}")
+            return []
 
+    def _preprocess_scraped(self, reviews):
+        """Preprocess freshly extracted reviews using CAMeL Tools"""
+        if not reviews:
             return reviews
 
+        try:
+            # The freshly extracted list is ours, so process it in place
+            return self.preprocess_reviews(reviews, in_place=True)
         except Exception as e:
             print(f"Error during scraping: {e}")
             return []
 
-    def save_to_csv(self, reviews, filename="google_maps_reviews.csv"):
-        """Save reviews to CSV file with UTF-8 encoding"""
+    def scrape_many(self, urls, num_reviews):
+        """Scrape several places with the same browser, returning one review list per URL"""
+        # Preprocessing (CPU) of each place runs on a background thread while the browser
+        # loads and scrolls the next place (I/O), so the two stages overlap. That thread
+        # preprocesses in-process, since forking workers from a threaded process is unsafe
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            futures = []
+            for url in urls:
+                # Reset state between places instead of paying for a new Chrome
+                if self.ensure_driver():
+                    try:
+                        self.driver.delete_all_cookies()
+                    except WebDriverException as e:
+                        print(f"Could not clear cookies: {e}")
+                reviews = self.extract_from_url(url, num_reviews)
+                futures.append(executor.submit(self._preprocess_scraped, reviews))
+
+            return [future.result() for future in futures]
+
+    @classmethod
+    def save_to_csv(cls, reviews, filename="google_maps_reviews.csv"):
+        """Save reviews (a list or any iterable) to CSV, or to Parquet/Feather by file extension"""
+        # A classmethod, so files can be written without starting a browser
         if not reviews:
             print("No reviews to save")
             return
 
-        with open(filename, 'w', newline='', encoding='utf-8-sig') as csvfile:
-            fieldnames = ['name', 'date', 'rating', 'text']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        suffix = pathlib.Path(filename).suffix.lower()
+        if suffix in ('.parquet', '.feather'):
+            if PYARROW_AVAILABLE:
+                table = cls._reviews_table(list(reviews))
+                if suffix == '.parquet':
+                    pa_parquet.write_table(table, filename, compression='snappy')
+                else:
+                    pa_feather.write_feather(table, filename, compression='lz4')
+                print(f"Reviews saved to {filename}")
+                return
+            filename = str(pathlib.Path(filename).with_suffix('.csv'))
+            print(f"Warning: pyarrow is required for {suffix} output, saving as {filename} instead")
+
+        # Lists are serialized in bulk; other iterables are streamed row by row.
+        # Both writers use minimal quoting and CRLF rows, so the bytes do not depend on the path taken
+        if isinstance(reviews, list) and PANDAS_AVAILABLE:
+            with cls._open_csv(filename) as csvfile:
+                pd.DataFrame(cls._reviews_columns(reviews)).to_csv(csvfile, index=False, quoting=csv.QUOTE_MINIMAL,
+                                                                   lineterminator='\r\n')
+        else:
+            cls._write_csv_rows(reviews, filename)
+
+        print(f"Reviews saved to {filename}")
+
+    @staticmethod
+    def _open_csv(filename):
+        """Open a buffered UTF-8 text stream for CSV output, with the BOM written once up front"""
+        raw = open(filename, 'wb', buffering=CSV_BUFFER_SIZE)
+        raw.write(codecs.BOM_UTF8)
+        return io.TextIOWrapper(raw, encoding='utf-8', newline='', write_through=False)
+
+    @classmethod
+    def _write_csv_rows(cls, reviews, filename):
+        """Stream reviews to CSV one row at a time through a large write buffer"""
+        with cls._open_csv(filename) as csvfile:
+            fieldnames = list(REVIEW_FIELDS)
+            writer = csv.DictWriter(csvfile, fieldnames=fieldnames, quoting=csv.QUOTE_MINIMAL)
 
             writer.writeheader()
-            for review in reviews:
-                writer.writerow(review)
+            writer.writerows(reviews)
+
+    @staticmethod
+    def _reviews_columns(reviews):
+        """Transpose review dicts into one list of strings per field, in REVIEW_FIELDS order"""
+        # Missing fields become empty cells as with DictWriter; stringifying up front stops pandas
+        # from turning a rating column like [5, None] into floats written as "5.0"
+        return {field: [_csv_cell(review.get(field)) for review in reviews] for field in REVIEW_FIELDS}
+
+    @classmethod
+    def _reviews_table(cls, reviews):
+        """Build a string-typed Arrow table of the review fields"""
+        schema = pa.schema([(field, pa.string()) for field in REVIEW_FIELDS])
+        # The columns are already stringified; Arrow will not cast e.g. an int rating into a string column
+        return pa.table(cls._reviews_columns(reviews), schema=schema)
+
+    def preprocess_to_csv(self, reviews, filename="google_maps_reviews.csv"):
+        """Preprocess reviews and stream them straight to CSV without holding the processed list"""
+        self.save_to_csv(self.text_processor.preprocess_reviews_iter(reviews), filename)
+
+    def scrape_reviews_to_csv(self, url, num_reviews, filename="google_maps_reviews.csv"):
+        """Scrape reviews and stream them through preprocessing into a CSV file as they are extracted"""
+        try:
+            if not self.load_reviews_page(url, num_reviews):
+                return False
 
-        print(f"Reviews saved to {filename}")
+            # Extracted reviews are fresh dicts, so preprocessing can reuse them
+            reviews = self.text_processor.preprocess_reviews_iter(self.iter_reviews(num_reviews), in_place=True)
+            self.save_to_csv(reviews, filename)
+            return True
+
+        except Exception as e:
+            print(f"Error during scraping: {e}")
+            return False
 
     def close(self):
         """Close the driver"""
         if self.driver:
             self.driver.quit()
+        if self.cache_slot is not None:
+            _release_cache_slot(self.cache_slot)
+            self.cache_slot = None
 
 
+@functools.lru_cache(maxsize=PREPROCESS_CACHE_SIZE)
 def detect_review_language(text):
-    """Detect if review is Arabic, English, or mixed"""
-    if not text or text == 'N/A':
-        return 'unknown'
+    """Detect if review is Arabic, English, or mixed (cached)"""
+    if not text or text == NA:
+        return UNKNOWN
 
-    # Count Arabic and English characters
-    arabic_chars = len(re.findall(r'[\u0600-\u06FF]', text))
-    english_chars = len(re.findall(r'[a-zA-Z]', text))
+    # Script ratios rather than langdetect: with only the en/ar profiles loaded it can
+    # tell nothing the scripts don't, and it has no notion of a mixed review
+    arabic_chars = _count_chars(text, _AR_DELETE)
+    english_chars = _count_chars(text, _EN_DELETE)
 
     total_chars = arabic_chars + english_chars
 
     if total_chars == 0:
-        return 'unknown'
+        return UNKNOWN
 
     arabic_ratio = arabic_chars / total_chars
     english_ratio = english_chars / total_chars
@@ -872,7 +1468,18 @@ def detect_review_language(text):
     elif arabic_ratio > 0.2 and english_ratio > 0.2:
         return 'mixed'
     else:
-        return 'unknown'
+        return UNKNOWN
+
+def detect_review_languages(texts):
+    """Detect the language of many reviews, classifying each distinct text only once"""
+    languages = {}
+    results = []
+    for text in texts:
+        language = languages.get(text)
+        if language is None:
+            language = languages[text] = detect_review_language(text)
+        results.append(language)
+    return results
 
         
 def main():
@@ -885,6 +1492,8 @@ def main():
         missing_deps.append("camel-tools")
     if not TEXTBLOB_AVAILABLE:
         missing_deps.append("textblob")
+    if not SYMSPELL_AVAILABLE:
+        missing_deps.append("symspellpy")
     if not LANGDETECT_AVAILABLE:
         missing_deps.append("langdetect")
 
@@ -894,7 +1503,7 @@ def main():
         print("Continuing with available features...\n")
 
     # Initialize processor once
-    processor = ReviewTextProcessor()
+    processor = get_text_processor()
 
     # Get input from user
     url = input("Enter the Google Maps place URL: ").strip()
@@ -934,6 +1543,9 @@ def main():
                 print(f"Text: {review['text'][:100]}..." if len(review['text']) > 100 else f"Text: {review['text']}")
                 print("-" * 50)
 
+            # Show samples
+            processor.show_random_samples(processed_reviews)
+
             # Save to CSV
             filename = input("\nEnter filename for CSV (press Enter for default): ").strip()
             if not filename:
@@ -958,42 +1570,72 @@ def main():
     finally:
         scraper.close()
 
-    if reviews:
-        # Add testing option
-        test_choice = input("\nRun preprocessing tests? (y/n): ").lower()
-        if test_choice == 'y':
-            processor = ReviewTextProcessor()
-            processor.test_preprocessing()
-
-        # Process reviews
-        processed_reviews = processor.preprocess_reviews(reviews)
-
-        # Show samples
-        processor.show_random_samples(processed_reviews)
+_SCRAPER_SINGLETON = None
+_SCRAPER_LOCK = threading.RLock()
+
+def _get_scraper():
+    """Return the shared scraper, starting Chrome on first use"""
+    global _SCRAPER_SINGLETON
+    with _SCRAPER_LOCK:
+        if _SCRAPER_SINGLETON is None:
+            _SCRAPER_SINGLETON = GoogleMapsReviewScraper()
+        return _SCRAPER_SINGLETON
+
+def _shutdown():
+    """Quit the shared scraper's browser at interpreter exit"""
+    global _SCRAPER_SINGLETON
+    with _SCRAPER_LOCK:
+        if _SCRAPER_SINGLETON is not None:
+            try:
+                _SCRAPER_SINGLETON.close()
+            except Exception:
+                pass
+            _SCRAPER_SINGLETON = None
 
-        # Save both original and processed versions
-        save_choice = input("\nSave both original and processed versions? (y/n): ").lower()
-        if save_choice == 'y':
-            scraper.save_to_csv(reviews, "original_reviews.csv")
-            scraper.save_to_csv(processed_reviews, "processed_reviews.csv")
-        else:
-            scraper.save_to_csv(processed_reviews, filename)
+atexit.register(_shutdown)
 
 def scrape_reviews_function(url, num_reviews):
     """Standalone function to scrape reviews"""
+    # One browser session is shared across calls; the lock keeps concurrent callers off it
+    with _SCRAPER_LOCK:
+        try:
+            return _get_scraper().scrape_many([url], num_reviews)[0]
+        except Exception as e:
+            print(f"Error in scraping: {e}")
+            return []
+
+def _scrape_batch(urls, num_reviews):
+    """Scrape a batch of URLs with a single scraper instance"""
     scraper = GoogleMapsReviewScraper()
     try:
-        reviews = scraper.scrape_reviews(url, num_reviews)
-        return reviews
+        return scraper.scrape_many(urls, num_reviews)
     except Exception as e:
         print(f"Error in scraping: {e}")
-        return []
+        return [[] for _ in urls]
     finally:
         scraper.close()
 
+def scrape_many_reviews_function(urls, num_reviews, max_workers=MAX_SCRAPER_WORKERS):
+    """Scrape several places concurrently, returning one review list per URL"""
+    urls = list(urls)
+    if not urls:
+        return []
+
+    workers = max(1, min(max_workers, len(urls)))
+
+    # Each worker reuses one Chrome for its share of the URLs; WebDriver calls block on
+    # I/O so the threads overlap well
+    batches = [urls[i::workers] for i in range(workers)]
+    results = [None] * len(urls)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_scrape_batch, batch, num_reviews) for batch in batches]
+        for i, future in enumerate(futures):
+            results[i::workers] = future.result()
+    return results
+
 def process_reviews_function(reviews):
     """Standalone function to process reviews"""
-    processor = ReviewTextProcessor()
+    processor = get_text_processor()
     try:
         processed_reviews = processor.preprocess_reviews(reviews)
         return processed_reviews
@@ -1003,17 +1645,16 @@ def process_reviews_function(reviews):
 
 def save_reviews_function(reviews, filename):
     """Standalone function to save reviews"""
-    scraper = GoogleMapsReviewScraper()
     try:
-        scraper.save_to_csv(reviews, filename)
+        GoogleMapsReviewScraper.save_to_csv(reviews, filename)
         return True
     except Exception as e:
         print(f"Error saving: {e}")
         return False
 
 # Make classes available for import
-__all__ = ['GoogleMapsReviewScraper', 'ReviewTextProcessor', 'scrape_reviews_function',
-           'process_reviews_function', 'save_reviews_function']
+__all__ = ['GoogleMapsReviewScraper', 'ReviewTextProcessor', 'get_text_processor', 'scrape_reviews_function',
+           'scrape_many_reviews_function', 'process_reviews_function', 'save_reviews_function']
 
 # Only run main() if script is executed directly
 if __name__ == "__main__":
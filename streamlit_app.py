@@ -1,17 +1,55 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import re
 import os
 import json
 import sys
 import io
+import csv
 import string
-from langdetect import detect, DetectorFactory
-
-# Set seed for reproducibility in langdetect
-DetectorFactory.seed = 0
+import functools
+
+# Relative review dates ("3 weeks ago") in seconds, in parse_date's precedence order;
+# a month counts as 30 days
+RELATIVE_DATE_UNITS = {
+    'minute': 60,
+    'hour': 60 * 60,
+    'day': 24 * 60 * 60,
+    'week': 7 * 24 * 60 * 60,
+    'month': 30 * 24 * 60 * 60,
+}
+# Units that also accept "a <unit> ago" without a number
+SINGULAR_DATE_UNITS = ('day', 'week', 'month')
+# Concurrent task uploads to ClickUp, each on a pooled keep-alive connection
+CLICKUP_UPLOAD_WORKERS = 8
+CLICKUP_POOL_SIZE = 16
+# Concurrent uploads can hit ClickUp's per-token rate limit; 429s are retried after Retry-After.
+# Read errors are never retried, since the task may already exist.
+CLICKUP_RETRY = Retry(total=3, connect=3, read=0, status=3, status_forcelist=(429,),
+                      allowed_methods=frozenset({'GET', 'POST'}), backoff_factor=1,
+                      respect_retry_after_header=True, raise_on_status=False)
+
+# Upper rating bounds of the Urgent/High/Normal ClickUp priorities; anything above is Low
+PRIORITY_RATING_BOUNDS = (2.0, 3.0, 4.0)
+
+# Spellings float() reads as NaN; such ratings compare false against every bound and end up Low
+NAN_LITERALS = ('nan', '+nan', '-nan')
+
+DATE_FORMATS = ('%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%d-%m-%Y', '%B %d, %Y', '%b %d, %Y')
+# "<n> <unit>" per relative date unit; parse_date only looks for the unit it picked
+_RE_RELATIVE_DATE_COUNTS = {unit: re.compile(rf'(\d+)\s*{unit}') for unit in RELATIVE_DATE_UNITS}
+_RE_LATIN_LETTER = re.compile(r'[A-Za-z]')
+
+# Pure-ASCII text with at least one letter, which the script-ratio detector always calls English
+ASCII_ENGLISH_PATTERN = r'[\x00-\x7f]*[A-Za-z][\x00-\x7f]*'
+# Rows run through language detection per round, as a multiple of the requested max results
+LANGUAGE_CANDIDATES_FACTOR = 3
 
 # --- Import from your scraper script ---
 try:
@@ -20,6 +58,7 @@ try:
         process_reviews_function,
         save_reviews_function,
         detect_review_language as scraper_detect_review_language, # Rename to avoid conflict with langdetect.detect
+        detect_review_languages as scraper_detect_review_languages,
         GoogleMapsReviewScraper,
         ReviewTextProcessor
     )
@@ -55,10 +94,8 @@ except ImportError as e:
             return False
 
     def scraper_detect_review_language(text): # Using the renamed function
-        try:
-            return detect(text)
-        except:
-            return "unknown"
+        # Shares the analyzer fallback's single factory instead of langdetect.detect
+        return _detect_language_fallback(text)
     
     class GoogleMapsReviewScraper:
         def __init__(self):
@@ -73,17 +110,124 @@ except ImportError as e:
         def process(self, reviews):
             return process_reviews_function(reviews)
 
+# langdetect profiles loaded for the fallback detector; the full set is 55 languages (~76MB)
+LANGDETECT_PROFILES = ('en', 'es', 'ar', 'fr', 'de', 'it', 'pt', 'ru', 'ja', 'ko',
+                       'zh-cn', 'zh-tw', 'hi', 'bn', 'id')
+
+# Language codes reported by CLD2/langdetect, mapped to the analyzer's filter labels
+LANGUAGE_LABELS = {'en': 'english', 'ar': 'arabic', 'un': 'unknown'}
+
+@functools.lru_cache(maxsize=1)
+def _get_cld2():
+    # CLD2 is optional; it is ~100x faster than langdetect when installed
+    try:
+        import pycld2
+        return pycld2
+    except ImportError:
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _get_langdetect_factory():
+    # A seeded factory holding only LANGDETECT_PROFILES, built on first use. langdetect is
+    # imported here so the app never loads it while the scraper's detector is in use.
+    try:
+        from langdetect import DetectorFactory, PROFILES_DIRECTORY
+    except ImportError:
+        return None
+
+    # A missing or corrupt profile file falls back to langdetect's own detector, as in the scraper
+    try:
+        profiles = []
+        for lang in LANGDETECT_PROFILES:
+            with open(os.path.join(PROFILES_DIRECTORY, lang), encoding='utf-8') as f:
+                profiles.append(f.read())
+
+        factory = DetectorFactory()
+        factory.seed = 0
+        factory.load_json_profile(profiles)
+        return factory
+    except Exception as e:
+        print(f"Warning: Could not load langdetect profiles: {e}")
+        return None
+
+@functools.lru_cache(maxsize=4096)
+def _detect_language_fallback(text):
+    # ASCII reviews with letters are taken as English without running the detector;
+    # only text with non-ASCII characters (Arabic, accented Latin, ...) pays for detection
+    if isinstance(text, str) and text.isascii() and _RE_LATIN_LETTER.search(text):
+        return "english"
+    try:
+        cld2 = _get_cld2()
+        if cld2 is not None:
+            code = cld2.detect(text)[2][0][1]
+        else:
+            factory = _get_langdetect_factory()
+            if factory is not None:
+                detector = factory.create()
+                detector.append(text)
+                code = detector.detect()
+            else:
+                # Raises ImportError (reported as unknown) when langdetect is not installed
+                from langdetect import detect
+                code = detect(text)
+    except Exception:
+        return "unknown"
+    return LANGUAGE_LABELS.get(code, code)
+
 # Override langdetect.detect with scraper's version if available, or keep the original for processing tab.
 # For consistency, the Streamlit app will use the detect_review_language from the scraper if it's available,
 # otherwise it will use the langdetect.detect or its own simple heuristic.
 if SCRAPER_AVAILABLE:
     _detect_language_for_analyzer = scraper_detect_review_language
+    _detect_languages_for_analyzer = scraper_detect_review_languages
 else:
-    def _detect_language_for_analyzer(text):
-        try:
-            return detect(text)
-        except:
-            return "unknown"
+    _detect_language_for_analyzer = _detect_language_fallback
+    def _detect_languages_for_analyzer(texts):
+        return [_detect_language_fallback(text) for text in texts]
+
+def _reviews_to_csv_bytes(rows):
+    # Review dicts straight to UTF-8-BOM CSV bytes for download buttons, without a DataFrame
+    buffer = io.StringIO()
+    buffer.write('\ufeff')
+    writer = csv.DictWriter(buffer, fieldnames=list(rows[0].keys()))
+    writer.writeheader()
+    # Missing values are written as empty cells, as DataFrame.to_csv did
+    writer.writerows({key: '' if pd.isna(value) else value for key, value in row.items()} for row in rows)
+    return buffer.getvalue().encode('utf-8')
+
+# Parsed once per distinct upload; Streamlit reruns the tab on every widget change
+@st.cache_data(show_spinner=False)
+def _load_reviews_csv(file_bytes):
+    return pd.read_csv(io.BytesIO(file_bytes), encoding='utf-8-sig')
+
+@st.cache_resource(show_spinner=False)
+def _clickup_session(token):
+    # One pooled session per token, kept across reruns, so ClickUp calls reuse TCP/TLS connections
+    session = requests.Session()
+    session.headers['Authorization'] = token
+    adapter = HTTPAdapter(pool_connections=CLICKUP_POOL_SIZE, pool_maxsize=CLICKUP_POOL_SIZE,
+                          max_retries=CLICKUP_RETRY)
+    session.mount('https://', adapter)
+    return session
+
+def _clickup_get(token, path):
+    response = _clickup_session(token).get(f"https://api.clickup.com/api/v2/{path}", timeout=10)
+    if response.status_code != 200:
+        raise requests.HTTPError(response.text, response=response)
+    return response.json()
+
+# Workspace/space/list listings rarely change, so reruns reuse them for a few minutes
+@st.cache_data(ttl=300, show_spinner=False)
+def load_clickup_workspaces(token):
+    return {team["name"]: team["id"] for team in _clickup_get(token, "team")["teams"]}
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_clickup_spaces(token, team_id):
+    return {space["name"]: space["id"] for space in _clickup_get(token, f"team/{team_id}/space")["spaces"]}
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_clickup_lists(token, space_id):
+    return {lst["name"]: lst["id"] for lst in _clickup_get(token, f"space/{space_id}/list")["lists"]}
 
 class ReviewAnalyzerWebApp:
     def __init__(self):
@@ -103,49 +247,89 @@ class ReviewAnalyzerWebApp:
             return None
 
         try:
-            original_date_str = date_str
             date_str = date_str.strip().lower()
 
             if 'ago' in date_str:
-                now = datetime.now()
-                if 'minute' in date_str:
-                    minutes = re.findall(r'(\d+)\s*minute', date_str)
-                    if minutes: return now - timedelta(minutes=int(minutes[0]))
-                elif 'hour' in date_str:
-                    hours = re.findall(r'(\d+)\s*hour', date_str)
-                    if hours: return now - timedelta(hours=int(hours[0]))
-                elif 'day' in date_str and 'week' not in date_str:
-                    days = re.findall(r'(\d+)\s*day', date_str)
-                    if days: return now - timedelta(days=int(days[0]))
-                    elif 'a day ago' in date_str: return now - timedelta(days=1)
-                elif 'week' in date_str:
-                    weeks = re.findall(r'(\d+)\s*week', date_str)
-                    if weeks: return now - timedelta(weeks=int(weeks[0]))
-                    elif 'a week ago' in date_str: return now - timedelta(weeks=1)
-                elif 'month' in date_str:
-                    months = re.findall(r'(\d+)\s*month', date_str)
-                    if months: return now - timedelta(days=int(months[0])*30)
-                    elif 'a month ago' in date_str: return now - timedelta(days=30)
-            
-            date_formats = [
-                '%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%d-%m-%Y', '%B %d, %Y', '%b %d, %Y',
-            ]
-            for fmt in date_formats:
+                # The first unit mentioned in RELATIVE_DATE_UNITS order decides, wherever it appears
+                # ("1 hour 30 minutes ago" is 30 minutes); "day" gives way to "week"
+                unit = next((unit for unit in RELATIVE_DATE_UNITS
+                             if unit in date_str and not (unit == 'day' and 'week' in date_str)), None)
+                if unit:
+                    match = _RE_RELATIVE_DATE_COUNTS[unit].search(date_str)
+                    if match:
+                        count = int(match.group(1))
+                    elif unit in SINGULAR_DATE_UNITS and f'a {unit} ago' in date_str:
+                        count = 1
+                    else:
+                        count = None
+                    if count is not None:
+                        return datetime.now() - timedelta(seconds=count * RELATIVE_DATE_UNITS[unit])
+
+            for fmt in DATE_FORMATS:
                 try: return datetime.strptime(date_str, fmt)
                 except ValueError: continue
             return None
         except Exception as e:
             return None
 
-    def get_priority_from_rating(self, rating):
-        try:
-            rating_num = float(rating)
-            if rating_num <= 2: return 1  # Urgent
-            elif rating_num <= 3: return 2  # High
-            elif rating_num <= 4: return 3  # Normal
-            else: return 4  # Low
-        except:
-            return 3  # Normal
+    def parse_dates(self, dates):
+        # Vectorized parse_date over a whole column; unparseable dates become NaT
+        parsed = pd.Series(pd.NaT, index=dates.index, dtype='datetime64[ns]')
+        if not (pd.api.types.is_object_dtype(dates) or pd.api.types.is_string_dtype(dates)):
+            return parsed
+
+        # Non-string cells turn into NaN here and stay NaT
+        normalized = dates.str.strip().str.lower()
+
+        relative = normalized[normalized.str.contains('ago', regex=False, na=False)]
+        if not relative.empty:
+            has_unit = {unit: relative.str.contains(unit, regex=False) for unit in RELATIVE_DATE_UNITS}
+            conditions = [has_unit['minute'], has_unit['hour'], has_unit['day'] & ~has_unit['week'],
+                          has_unit['week'], has_unit['month']]
+            units = pd.Series(np.select(conditions, list(RELATIVE_DATE_UNITS), default=''), index=relative.index)
+
+            seconds = pd.Series(np.nan, index=relative.index)
+            for unit, unit_seconds in RELATIVE_DATE_UNITS.items():
+                rows = relative[units == unit]
+                if rows.empty:
+                    continue
+                counts = pd.to_numeric(rows.str.extract(rf'(\d+)\s*{unit}', expand=False))
+                if unit in SINGULAR_DATE_UNITS:
+                    counts[counts.isna() & rows.str.contains(f'a {unit} ago', regex=False)] = 1
+                seconds[rows.index] = counts * unit_seconds
+
+            seconds = seconds.dropna()
+            parsed[seconds.index] = pd.Timestamp(datetime.now()) - pd.to_timedelta(seconds, unit='s')
+
+        # Everything else (including relative dates that did not resolve) tries the absolute formats
+        for fmt in DATE_FORMATS:
+            remaining = parsed.isna() & normalized.notna()
+            if not remaining.any():
+                break
+            parsed[remaining] = pd.to_datetime(normalized[remaining], format=fmt, errors='coerce')
+
+        return parsed
+
+    def prepare_reviews_df(self, reviews_df):
+        # Typed columns for the search filters: names/ratings repeat, so store them as
+        # categories, and parse dates once at load time instead of on every search
+        for column in ('name', 'rating'):
+            if column in reviews_df:
+                reviews_df[column] = reviews_df[column].astype('category')
+        if 'date' in reviews_df:
+            reviews_df['parsed_date'] = self.parse_dates(reviews_df['date'])
+        return reviews_df
+
+    def get_priorities_from_ratings(self, ratings):
+        # Same mapping as one float(rating) per review, computed for the whole batch
+        rating_series = pd.Series(ratings, dtype=object)
+        rating_nums = pd.to_numeric(rating_series, errors='coerce').to_numpy(dtype=float)
+        # <=2 -> 1 (Urgent), <=3 -> 2 (High), <=4 -> 3 (Normal), else 4 (Low); NaN sorts last, so it is Low
+        priorities = np.searchsorted(PRIORITY_RATING_BOUNDS, rating_nums, side='left') + 1
+        # Ratings that are not numbers at all (None, "4 stars", ...) get Normal priority
+        nan_ratings = rating_series.map(str).str.strip().str.lower().isin(NAN_LITERALS).to_numpy()
+        priorities[np.isnan(rating_nums) & ~nan_ratings] = 3
+        return priorities.tolist()
 
     def setup_scraper_tab(self):
         st.header("Google Maps Review Scraper")
@@ -202,11 +386,9 @@ class ReviewAnalyzerWebApp:
 
             col1, col2 = st.columns(2)
             with col1:
-                df_to_save = pd.DataFrame(self.all_reviews)
-                csv = df_to_save.to_csv(index=False).encode('utf-8-sig')
                 st.download_button(
                     label="Download Scraped Reviews CSV",
-                    data=csv,
+                    data=_reviews_to_csv_bytes(self.all_reviews),
                     file_name="scraped_reviews.csv",
                     mime="text/csv",
                     key="download_scraped_csv"
@@ -214,7 +396,7 @@ class ReviewAnalyzerWebApp:
             with col2:
                 if st.button("Use for Analysis", key="use_for_analysis_button"):
                     if self.all_reviews:
-                        self.reviews_df = pd.DataFrame(self.all_reviews)
+                        self.reviews_df = self.prepare_reviews_df(pd.DataFrame(self.all_reviews))
                         st.session_state['reviews_df'] = self.reviews_df
                         st.session_state['file_loaded_status'] = f"{len(self.all_reviews)} reviews loaded from scraper"
                         st.success(f"Loaded {len(self.all_reviews)} reviews for analysis.")
@@ -229,8 +411,13 @@ class ReviewAnalyzerWebApp:
         uploaded_file = st.file_uploader("Upload CSV File", type="csv", key="file_uploader")
         
         if uploaded_file is not None:
-            self.reviews_df = pd.read_csv(uploaded_file, encoding='utf-8-sig')
-            st.session_state['reviews_df'] = self.reviews_df
+            # The uploader hands back the same file on every rerun; only a new upload (a new file_id,
+            # even for an edited file with the same name and size) is prepared again
+            file_key = uploaded_file.file_id
+            if st.session_state.get('reviews_file_key') != file_key or st.session_state.get('reviews_df') is None:
+                st.session_state['reviews_df'] = self.prepare_reviews_df(_load_reviews_csv(uploaded_file.getvalue()))
+                st.session_state['reviews_file_key'] = file_key
+            self.reviews_df = st.session_state['reviews_df']
             st.session_state['file_loaded_status'] = f"Loaded: {uploaded_file.name} ({len(self.reviews_df)} reviews)"
             st.success(st.session_state['file_loaded_status'])
         elif 'reviews_df' in st.session_state and st.session_state['reviews_df'] is not None:
@@ -262,7 +449,7 @@ class ReviewAnalyzerWebApp:
 
             if st.button("Search Reviews", key="search_reviews_button") or (
                 self.reviews_df is not None and 
-                (st.session_state.get('filtered_reviews') is None or not st.session_state.get('filtered_reviews'))
+                (st.session_state.get('filtered_reviews') is None or st.session_state['filtered_reviews'].empty)
             ):
                 if self.reviews_df is None:
                     st.error("Please load a CSV file first or use scraped reviews.")
@@ -275,38 +462,66 @@ class ReviewAnalyzerWebApp:
                     return
                 
                 with st.spinner("Searching reviews..."):
-                    filtered_df = self.reviews_df.copy()
+                    # Filters only select rows, so the loaded frame is read without copying it
+                    filtered_df = self.reviews_df
 
                     # Step 1: Filter by time period
                     cutoff_date = datetime.now() - timedelta(days=days)
                     
-                    filtered_df['parsed_date'] = filtered_df['date'].apply(self.parse_date)
-                    filtered_df = filtered_df[filtered_df['parsed_date'].notna()]
-                    filtered_df = filtered_df[filtered_df['parsed_date'] >= cutoff_date]
+                    if 'parsed_date' in filtered_df:
+                        parsed_dates = filtered_df['parsed_date']
+                    else:
+                        parsed_dates = self.parse_dates(filtered_df['date'])
+                    # NaT never passes the cutoff, so undated reviews drop out here too
+                    date_mask = parsed_dates >= cutoff_date
+                    filtered_df = filtered_df.loc[date_mask].assign(parsed_date=parsed_dates[date_mask])
 
                     # Apply keyword filtering if keywords are provided
                     if keywords:
-                        keyword_condition = False
-                        for kw in keywords:
-                            kw_lower = kw.lower()
-                            keyword_condition |= (filtered_df['text'].str.lower().str.contains(kw_lower, na=False) |
-                                                  filtered_df['name'].str.lower().str.contains(kw_lower, na=False))
+                        # One alternation of all keywords, scanned once per lowercased column
+                        keyword_pattern = '|'.join(re.escape(kw.lower()) for kw in keywords)
+                        keyword_condition = (filtered_df['text'].str.lower().str.contains(keyword_pattern, na=False) |
+                                             filtered_df['name'].str.lower().str.contains(keyword_pattern, na=False))
                         filtered_df = filtered_df[keyword_condition]
                     
                     # Step 3: Filter by language
                     if selected_language != "all":
-                        filtered_df['detected_lang'] = filtered_df['text'].apply(_detect_language_for_analyzer)
-                        if selected_language == "mixed":
-                            filtered_df = filtered_df[filtered_df['detected_lang'] == "mixed"]
-                        else:
-                            filtered_df = filtered_df[filtered_df['detected_lang'] == selected_language]
-
-                    # Step 4: Limit results
-                    self.filtered_reviews = filtered_df.head(max_results).to_dict('records')
+                        filtered_df = self.filter_by_language(filtered_df, selected_language, max_results)
+
+                    # Step 4: Limit results, labelling the shown reviews in one batch if no language filter did
+                    filtered_df = filtered_df.head(max_results)
+                    if 'detected_lang' not in filtered_df:
+                        filtered_df = filtered_df.assign(detected_lang=_detect_languages_for_analyzer(filtered_df['text'].tolist()))
+                    # Kept columnar; rows become dicts only where a consumer needs them (ClickUp upload)
+                    self.filtered_reviews = filtered_df.reset_index(drop=True)
                     st.session_state['filtered_reviews'] = self.filtered_reviews
                 
                 self.display_search_results(keyword_input, days, selected_language)
 
+    def filter_by_language(self, reviews_df, language, max_results):
+        # Detect in rounds of candidates and stop once max_results reviews match, so the
+        # detector only runs on about as many rows as can be displayed
+        chunk_size = max_results * LANGUAGE_CANDIDATES_FACTOR
+        matches = []
+        found = 0
+        for start in range(0, max(len(reviews_df), 1), chunk_size):
+            chunk = reviews_df.iloc[start:start + chunk_size]
+            texts = chunk['text']
+
+            # ASCII reviews are labelled English without calling the detector
+            ascii_english = texts.str.fullmatch(ASCII_ENGLISH_PATTERN, na=False)
+            detected = pd.Series('english', index=chunk.index, dtype=object)
+            detected[~ascii_english] = _detect_languages_for_analyzer(texts[~ascii_english].tolist())
+
+            chunk = chunk.assign(detected_lang=detected)
+            chunk = chunk[chunk['detected_lang'] == language]
+            matches.append(chunk)
+            found += len(chunk)
+            if found >= max_results:
+                break
+
+        return pd.concat(matches)
+
     def display_search_results(self, keyword_input, days, language_filter):
         lang_desc = {
             "all": "all languages",
@@ -315,7 +530,7 @@ class ReviewAnalyzerWebApp:
             "mixed": "mixed content"
         }.get(language_filter, language_filter)
 
-        if not self.filtered_reviews:
+        if self.filtered_reviews is None or self.filtered_reviews.empty:
             st.warning(f"No reviews found containing '{keyword_input}' in {lang_desc} from the last {days} days.")
             st.markdown(f"""
             DEBUG INFO:
@@ -328,23 +543,22 @@ class ReviewAnalyzerWebApp:
         else:
             st.success(f"Found {len(self.filtered_reviews)} reviews containing '{keyword_input}' in {lang_desc} from the last {days} days:")
             st.markdown("---")
-            for i, review in enumerate(self.filtered_reviews):
-                review_text = review.get('text', 'N/A')
-                title_text = review.get('name', 'N/A')
-                detected_lang = _detect_language_for_analyzer(review_text)
+            for i, review in enumerate(self.filtered_reviews.itertuples(index=False)):
+                review_text = getattr(review, 'text', 'N/A')
+                title_text = getattr(review, 'name', 'N/A')
+                # Detected once for all results during the search
+                detected_lang = getattr(review, 'detected_lang', 'unknown')
 
                 st.markdown(f"**Review {i+1}:** [{detected_lang.upper()}]")
                 st.markdown(f"**Name:** {title_text}")
-                st.markdown(f"**Date:** {review.get('date', 'N/A')}")
-                st.markdown(f"**Rating:** {review.get('rating', 'N/A')}")
+                st.markdown(f"**Date:** {getattr(review, 'date', 'N/A')}")
+                st.markdown(f"**Rating:** {getattr(review, 'rating', 'N/A')}")
                 st.markdown(f"**Review:** {review_text}")
                 st.markdown("---")
             
-            df_to_export = pd.DataFrame(self.filtered_reviews)
-            csv = df_to_export.to_csv(index=False).encode('utf-8-sig')
             st.download_button(
                 label="Export Filtered Results (CSV)",
-                data=csv,
+                data=self.filtered_reviews.to_csv(index=False).encode('utf-8-sig'),
                 file_name="filtered_reviews.csv",
                 mime="text/csv",
                 key="download_filtered_csv"
@@ -376,7 +590,8 @@ class ReviewAnalyzerWebApp:
                 if api_token:
                     headers = {"Authorization": api_token}
                     try:
-                        response = requests.get("https://api.clickup.com/api/v2/user", headers=headers, timeout=10)
+                        # Opens the token's pooled connection that the loaders and upload then reuse
+                        response = _clickup_session(api_token).get("https://api.clickup.com/api/v2/user", timeout=10)
                         if response.status_code == 200:
                             user_data = response.json()
                             username = user_data.get('user', {}).get('username', 'Unknown')
@@ -398,14 +613,11 @@ class ReviewAnalyzerWebApp:
             if st.button("Load Workspaces", key="load_workspaces_button"):
                 if st.session_state['clickup_headers']:
                     try:
-                        response = requests.get("https://api.clickup.com/api/v2/team", headers=st.session_state['clickup_headers'])
-                        if response.status_code == 200:
-                            teams = response.json()["teams"]
-                            workspace_names = [(team["name"], team["id"]) for team in teams]
-                            st.session_state['workspace_data'] = {name: team_id for name, team_id in workspace_names}
-                            st.success(f"Loaded {len(workspace_names)} workspaces.")
-                        else:
-                            st.error(f"Failed to load workspaces: {response.text}")
+                        token = st.session_state['clickup_headers']["Authorization"]
+                        st.session_state['workspace_data'] = load_clickup_workspaces(token)
+                        st.success(f"Loaded {len(st.session_state['workspace_data'])} workspaces.")
+                    except requests.HTTPError as e:
+                        st.error(f"Failed to load workspaces: {str(e)}")
                     except Exception as e:
                         st.error(f"Failed to connect to ClickUp: {str(e)}")
                 else:
@@ -420,14 +632,9 @@ class ReviewAnalyzerWebApp:
         if selected_workspace and st.session_state['workspace_data'] and st.button("Load Spaces", key="load_spaces_button"):
             team_id = st.session_state['workspace_data'][selected_workspace]
             try:
-                response = requests.get(f"https://api.clickup.com/api/v2/team/{team_id}/space", headers=st.session_state['clickup_headers'])
-                if response.status_code == 200:
-                    spaces = response.json()["spaces"]
-                    space_names = [(space["name"], space["id"]) for space in spaces]
-                    st.session_state['space_data'] = {name: space_id for name, space_id in space_names}
-                    st.success(f"Loaded {len(space_names)} spaces for {selected_workspace}.")
-                else:
-                    st.error(f"Failed to load spaces: {response.text}")
+                token = st.session_state['clickup_headers']["Authorization"]
+                st.session_state['space_data'] = load_clickup_spaces(token, team_id)
+                st.success(f"Loaded {len(st.session_state['space_data'])} spaces for {selected_workspace}.")
             except Exception as e:
                 st.error(f"Failed to load spaces: {str(e)}")
         
@@ -438,14 +645,9 @@ class ReviewAnalyzerWebApp:
         if selected_space and st.session_state['space_data'] and st.button("Load Lists", key="load_lists_button"):
             space_id = st.session_state['space_data'][selected_space]
             try:
-                response = requests.get(f"https://api.clickup.com/api/v2/space/{space_id}/list", headers=st.session_state['clickup_headers'])
-                if response.status_code == 200:
-                    lists = response.json()["lists"]
-                    list_names = [(lst["name"], lst["id"]) for lst in lists]
-                    st.session_state['list_data'] = {name: list_id for name, list_id in list_names}
-                    st.success(f"Loaded {len(list_names)} lists for {selected_space}.")
-                else:
-                    st.error(f"Failed to load lists: {response.text}")
+                token = st.session_state['clickup_headers']["Authorization"]
+                st.session_state['list_data'] = load_clickup_lists(token, space_id)
+                st.success(f"Loaded {len(st.session_state['list_data'])} lists for {selected_space}.")
             except Exception as e:
                 st.error(f"Failed to load lists: {str(e)}")
         
@@ -472,8 +674,8 @@ class ReviewAnalyzerWebApp:
 
             data_to_upload = []
             if data_type == "Filtered Data":
-                if 'filtered_reviews' in st.session_state and st.session_state['filtered_reviews']:
-                    data_to_upload = st.session_state['filtered_reviews']
+                if st.session_state.get('filtered_reviews') is not None and not st.session_state['filtered_reviews'].empty:
+                    data_to_upload = st.session_state['filtered_reviews'].to_dict('records')
                 else:
                     st.error("No filtered reviews available to upload. Please perform a search first.")
                     return
@@ -485,8 +687,8 @@ class ReviewAnalyzerWebApp:
                     return
 
             if data_to_upload:
-                st.session_state['clickup_status_text_log'] = f"Starting upload of {len(data_to_upload)} individual review tasks...\n"
-                st.session_state['clickup_status_text_log'] += "=" * 50 + "\n"
+                # Log lines are collected locally and joined into session state once at the end
+                log_lines = [f"Starting upload of {len(data_to_upload)} individual review tasks...\n", "=" * 50 + "\n"]
                 progress_bar = st.progress(0)
                 successful_uploads = 0
 
@@ -495,44 +697,56 @@ class ReviewAnalyzerWebApp:
                     st.error("ClickUp API headers not set. Please test connection first.")
                     return
 
-                for i, review in enumerate(data_to_upload):
+                session = _clickup_session(headers["Authorization"])
+
+                priorities = self.get_priorities_from_ratings([review.get('rating', 0) for review in data_to_upload])
+
+                # Runs on worker threads, so it only talks HTTP; Streamlit calls stay on this thread
+                def upload_one(item, priority):
+                    i, review = item
                     task_name = f"{place_name} - Review {i + 1}"
-                    description = f"**Review from {place_name}**\n\n"
-                    description += f"**Name:** {review.get('name', 'N/A')}\n"
-                    description += f"**Date:** {review.get('date', 'N/A')}\n"
-                    description += f"**Rating:** {review.get('rating', 'N/A')}\n"
-                    description += f"**Review:** {review.get('text', 'N/A')}\n"
+                    description = "\n".join([
+                        f"**Review from {place_name}**",
+                        "",
+                        f"**Name:** {review.get('name', 'N/A')}",
+                        f"**Date:** {review.get('date', 'N/A')}",
+                        f"**Rating:** {review.get('rating', 'N/A')}",
+                        f"**Review:** {review.get('text', 'N/A')}",
+                        "",
+                    ])
 
                     task_data = {
                         "name": task_name,
                         "description": description,
                         "status": "to do",
-                        "priority": self.get_priority_from_rating(review.get('rating', 0)),
+                        "priority": priority,
                         "tags": []
                     }
 
                     try:
-                        response = requests.post(
+                        response = session.post(
                             f"https://api.clickup.com/api/v2/list/{list_id}/task",
-                            headers=headers,
                             json=task_data,
                             timeout=10
                         )
                         if response.status_code == 200:
-                            successful_uploads += 1
-                            st.session_state['clickup_status_text_log'] += f"✅ Uploaded Review {i + 1}: {task_name}\n"
-                        else:
-                            st.session_state['clickup_status_text_log'] += f"❌ Failed to upload Review {i + 1}: {task_name} - {response.status_code} - {response.text}\n"
+                            return True, f"✅ Uploaded Review {i + 1}: {task_name}\n"
+                        return False, f"❌ Failed to upload Review {i + 1}: {task_name} - {response.status_code} - {response.text}\n"
                     except requests.exceptions.Timeout:
-                        st.session_state['clickup_status_text_log'] += f"❌ Failed to upload Review {i + 1}: {task_name} - Timeout\n"
+                        return False, f"❌ Failed to upload Review {i + 1}: {task_name} - Timeout\n"
                     except Exception as e:
-                        st.session_state['clickup_status_text_log'] += f"❌ Failed to upload Review {i + 1}: {task_name} - Error: {str(e)}\n"
-                    
-                    progress_bar.progress((i + 1) / len(data_to_upload))
-                    st.session_state['clickup_status_text_log'] = st.session_state['clickup_status_text_log'] # Rerun to update log
-
-                st.session_state['clickup_status_text_log'] += "=" * 50 + "\n"
-                st.session_state['clickup_status_text_log'] += f"Final Upload Summary: {successful_uploads} out of {len(data_to_upload)} reviews uploaded.\n"
+                        return False, f"❌ Failed to upload Review {i + 1}: {task_name} - Error: {str(e)}\n"
+
+                # map() yields in submission order, so the log and progress stay in review order
+                with ThreadPoolExecutor(max_workers=CLICKUP_UPLOAD_WORKERS) as executor:
+                    for i, (uploaded, log_line) in enumerate(executor.map(upload_one, enumerate(data_to_upload), priorities)):
+                        successful_uploads += uploaded
+                        log_lines.append(log_line)
+                        progress_bar.progress((i + 1) / len(data_to_upload))
+
+                log_lines.append("=" * 50 + "\n")
+                log_lines.append(f"Final Upload Summary: {successful_uploads} out of {len(data_to_upload)} reviews uploaded.\n")
+                st.session_state['clickup_status_text_log'] = "".join(log_lines)
                 if successful_uploads == len(data_to_upload):
                     st.success(f"Successfully uploaded {successful_uploads} reviews to ClickUp!")
                     st.session_state['clickup_status'] = f"Upload Complete: {successful_uploads} reviews uploaded"
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+import csv
+import errno
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import google_maps_scraper as gms
+
+
+@pytest.mark.skipif(not gms.SYMSPELL_AVAILABLE, reason="symspellpy not installed")
+def test_spell_correct_keeps_contractions():
+    text = "It isn't bad, but I didn't like it and it wasn't cheap"
+    assert gms._spell_correct(text) == text
+
+
+REVIEWS = [
+    {'name': 'Ahmed', 'date': '2 weeks ago', 'rating': 5, 'text': 'Great, "really" great'},
+    {'name': 'سارة', 'date': 'a month ago', 'rating': 4.5, 'text': 'مكان رائع\nline two'},
+    {'name': 'N/A', 'date': 'N/A', 'rating': None, 'text': ''},
+]
+
+
+def _baseline_csv(path):
+    """Bytes written by the original DictWriter-based save_to_csv"""
+    with open(path, 'w', newline='', encoding='utf-8-sig') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=['name', 'date', 'rating', 'text'])
+        writer.writeheader()
+        for review in REVIEWS:
+            writer.writerow(review)
+    return path.read_bytes()
+
+
+@pytest.mark.parametrize('path', ['pandas', 'rows_list', 'rows_iter'])
+def test_save_to_csv_matches_baseline_bytes(tmp_path, monkeypatch, path):
+    expected = _baseline_csv(tmp_path / 'baseline.csv')
+
+    reviews = [dict(review) for review in REVIEWS]
+    if path == 'pandas' and not gms.PANDAS_AVAILABLE:
+        pytest.skip("pandas not installed")
+    if path == 'rows_list':
+        monkeypatch.setattr(gms, 'PANDAS_AVAILABLE', False)
+    if path == 'rows_iter':
+        reviews = iter(reviews)
+
+    out = tmp_path / 'out.csv'
+    gms.GoogleMapsReviewScraper.save_to_csv(reviews, str(out))
+    assert out.read_bytes() == expected
+
+
+@pytest.mark.skipif(not gms.PYARROW_AVAILABLE, reason="pyarrow not installed")
+@pytest.mark.parametrize('suffix', ['.parquet', '.feather'])
+def test_save_to_columnar_accepts_numeric_ratings(tmp_path, suffix):
+    out = tmp_path / f'out{suffix}'
+    gms.GoogleMapsReviewScraper.save_to_csv(REVIEWS, str(out))
+    table = gms.pa_parquet.read_table(out) if suffix == '.parquet' else gms.pa_feather.read_table(out)
+    assert table.column('rating').to_pylist() == ['5', '4.5', None]
+
+
+def test_save_reviews_function_does_not_start_a_browser(tmp_path, monkeypatch):
+    monkeypatch.setattr(gms, '_get_scraper', lambda: pytest.fail("save_reviews_function started a scraper"))
+    out = tmp_path / 'out.csv'
+    assert gms.save_reviews_function(REVIEWS, str(out))
+    assert out.read_bytes() == _baseline_csv(tmp_path / 'baseline.csv')
+
+
+@pytest.fixture
+def stub_processor():
+    # Skip __init__ so no models load; only the batch bookkeeping is under test
+    processor = gms.ReviewTextProcessor.__new__(gms.ReviewTextProcessor)
+    processor.verbose = False
+    processor.report_progress = False
+    processor.clean_reviewer_name = str.upper
+    processor.process_review_text = lambda text, dialect=None: text + '!'
+    return processor
+
+
+def test_preprocess_batch_copy_keeps_every_key(stub_processor):
+    reviews = [{'name': 'ahmed', 'text': 'good', 'url': 'https://maps.example/1'}]
+    processed = stub_processor.preprocess_batch(reviews)
+    assert processed == [{'name': 'AHMED', 'text': 'good!', 'url': 'https://maps.example/1'}]
+    assert reviews[0]['name'] == 'ahmed'
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(gms, 'CHROME_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(gms, '_CACHE_SLOTS', {})
+    return tmp_path
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="patches fcntl.flock")
+def test_cache_slot_without_lock_support_runs_uncached(cache_dir, monkeypatch):
+    def flock(fd, operation):
+        raise OSError(errno.ENOLCK, "No locks available")
+    monkeypatch.setattr(gms.fcntl, 'flock', flock)
+
+    assert gms._acquire_cache_slot() is None
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="patches fcntl.flock")
+def test_cache_slots_are_capped(cache_dir, monkeypatch):
+    def flock(fd, operation):
+        raise BlockingIOError(errno.EWOULDBLOCK, "Resource temporarily unavailable")
+    monkeypatch.setattr(gms.fcntl, 'flock', flock)
+
+    assert gms._acquire_cache_slot() is None
+    assert len(list(cache_dir.iterdir())) == gms.CHROME_CACHE_MAX_SLOTS
+
+
+def test_get_text_processor_builds_one_processor_under_concurrency(monkeypatch):
+    built = []
+
+    class SlowProcessor:
+        def __init__(self):
+            built.append(threading.get_ident())
+            time.sleep(0.05)  # stands in for the model loading that must not run twice
+
+    monkeypatch.setattr(gms, 'ReviewTextProcessor', SlowProcessor)
+    monkeypatch.setattr(gms, '_TEXT_PROCESSOR', None)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        processors = list(executor.map(lambda _: gms.get_text_processor(), range(8)))
+
+    assert len(built) == 1
+    assert all(processor is processors[0] for processor in processors)